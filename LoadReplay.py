@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+# ----------------------------------------------------------------------------------
+# Project: BeamtimeApp
+# File: LoadReplay.py
+# ----------------------------------------------------------------------------------
+# Purpose:
+# This is the entry point for the load replay tool. This file is used to replay the
+# werkzeug access records from logs/flask.log against a running BeamtimeApp instance
+# and report the latency, errors and database pool usage per endpoint.
+# ----------------------------------------------------------------------------------
+# Author: Christofanis Skordas
+#
+# Copyright (C) 2025 GSECARS, The University of Chicago, USA
+# Copyright (C) 2025 NSF SEES, USA
+# ----------------------------------------------------------------------------------
+
+import argparse
+import datetime
+import json
+import math
+import re
+import threading
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+# Matches a werkzeug access record written with the app log format, e.g.
+# 2025-06-01 09:00:00,123 | INFO | 127.0.0.1 - - [01/Jun/2025 09:00:00] "GET /api/v1/?run=1 HTTP/1.1" 200 -
+ACCESS_RECORD = re.compile(
+    r"^(?P<time>\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2},\d{3}) \| \w+ \| .*?"
+    r'"(?P<method>[A-Z]+) (?P<path>\S+) HTTP/[\d.]+" (?P<status>\d{3})'
+)
+
+# Matches the ANSI color codes werkzeug wraps around the request line of non-200 records
+ANSI_STYLE = re.compile(r"\x1b\[[0-9;]*m")
+
+# Request bodies for the POST endpoints, since the access log does not record them. The
+# defaults can be replaced with --post-body to match the experiments of the database
+POST_BODIES = {
+    "/api/v1/validate_data_path": {"path": "/tmp"},
+    "/api/v1/expand_data_paths": {"station_id": 1, "technique_id": 1, "experiment_ids": list(range(1, 201))},
+}
+
+# Endpoints that modify the database and are only replayed when explicitly requested
+WRITE_ENDPOINTS = {"/api/v1/create_update_queue"}
+
+
+@dataclass
+class AccessRecord:
+    """A single request parsed from the access log."""
+
+    timestamp: float
+    method: str
+    path: str
+    status: int
+
+    @property
+    def endpoint(self) -> str:
+        """Returns the endpoint used to group the results."""
+        endpoint = self.path.split("?", 1)[0]
+        if endpoint.startswith("/static/"):
+            endpoint = "/static/*"
+        return f"{self.method} {endpoint}"
+
+
+@dataclass
+class EndpointStats:
+    """Latency, error and pool usage samples collected for an endpoint."""
+
+    latencies: list[float] = field(default_factory=list)
+    lags: list[float] = field(default_factory=list)
+    errors: int = 0
+    client_errors: int = 0
+    pool_checked_out: list[int] = field(default_factory=list)
+    pool_overflow: list[int] = field(default_factory=list)
+    pool_saturated: int = 0
+
+
+def parse_access_log(paths: list[Path]) -> list[AccessRecord]:
+    """Parses the access records from the given log files, ordered by time."""
+    records = []
+
+    for path in paths:
+        with path.open(encoding="utf-8", errors="replace") as log:
+            for line in log:
+                match = ACCESS_RECORD.match(ANSI_STYLE.sub("", line))
+                if not match:
+                    continue
+
+                timestamp = datetime.datetime.strptime(match["time"], "%Y-%m-%d %H:%M:%S,%f").timestamp()
+                records.append(AccessRecord(timestamp, match["method"], match["path"], int(match["status"])))
+
+    records.sort(key=lambda record: record.timestamp)
+    return records
+
+
+def percentile(samples: list[float], percent: float) -> float:
+    """Returns the nearest-rank percentile of the samples."""
+    if not samples:
+        return 0.0
+
+    ordered = sorted(samples)
+    rank = max(math.ceil(percent / 100 * len(ordered)) - 1, 0)
+    return ordered[min(rank, len(ordered) - 1)]
+
+
+class LoadReplay:
+    """
+    Replays access records against a BeamtimeApp instance.
+
+    Requests are started at their original offsets divided by the speed-up factor, on a
+    thread pool bounded by the concurrency limit. When all workers are busy requests
+    start late, and that delay is reported as schedule lag.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        speedup: float = 1.0,
+        concurrency: int = 16,
+        timeout: float = 30.0,
+        post_bodies: dict[str, Any] | None = None,
+    ) -> None:
+        self._base_url = base_url.rstrip("/")
+        self._post_bodies = POST_BODIES | (post_bodies or {})
+        self._speedup = speedup
+        self._concurrency = concurrency
+        self._timeout = timeout
+        self._stats: dict[str, EndpointStats] = {}
+        self._lock = threading.Lock()
+
+    def run(self, records: list[AccessRecord]) -> dict[str, EndpointStats]:
+        """Replays the records, preserving their inter-arrival times, and returns the stats."""
+        if not records:
+            return {}
+
+        first_timestamp = records[0].timestamp
+        start = time.monotonic()
+
+        with ThreadPoolExecutor(max_workers=self._concurrency) as executor:
+            for record in records:
+                scheduled = start + (record.timestamp - first_timestamp) / self._speedup
+                delay = scheduled - time.monotonic()
+                if delay > 0:
+                    time.sleep(delay)
+                executor.submit(self._send, record, scheduled)
+
+        return self._stats
+
+    def _send(self, record: AccessRecord, scheduled: float) -> None:
+        """Sends a single request and records its latency, errors and pool usage."""
+        body = self._post_bodies.get(record.path.split("?", 1)[0]) if record.method == "POST" else None
+        request = urllib.request.Request(
+            self._base_url + record.path,
+            data=json.dumps(body).encode() if body is not None else None,
+            headers={"Content-Type": "application/json"} if body is not None else {},
+            method=record.method,
+        )
+
+        started = time.monotonic()
+        error = False
+        client_error = False
+        headers = {}
+        try:
+            with urllib.request.urlopen(request, timeout=self._timeout) as response:
+                response.read()
+                headers = response.headers
+        except urllib.error.HTTPError as e:
+            error = e.code >= 500
+            client_error = 400 <= e.code < 500
+            headers = e.headers
+        except (urllib.error.URLError, OSError):
+            error = True
+        latency = time.monotonic() - started
+
+        with self._lock:
+            stats = self._stats.setdefault(record.endpoint, EndpointStats())
+            stats.latencies.append(latency)
+            stats.lags.append(max(started - scheduled, 0.0))
+            stats.errors += error
+            stats.client_errors += client_error
+
+            # Pool usage is only reported when the app runs with POOL_STATUS_HEADERS=true. The
+            # counts are the peaks seen while the request checked out its connections
+            if headers and headers.get("X-DB-Pool-Checked-Out") is not None:
+                checked_out = int(headers["X-DB-Pool-Checked-Out"])
+                capacity = int(headers.get("X-DB-Pool-Size", 0)) + int(headers.get("X-DB-Pool-Max-Overflow", 0))
+                stats.pool_checked_out.append(checked_out)
+                stats.pool_overflow.append(int(headers.get("X-DB-Pool-Overflow", 0)))
+                stats.pool_saturated += checked_out >= capacity
+
+
+def print_report(stats: dict[str, EndpointStats]) -> None:
+    """Prints the latency percentiles, errors and pool usage per endpoint."""
+    print(
+        f"{'Endpoint':<40} {'Count':>7} {'Errors':>7} {'4xx':>7} {'p50 ms':>8} {'p90 ms':>8} {'p99 ms':>8} "
+        f"{'Max ms':>8} {'Lag p99':>8} {'Pool max':>8} {'Overflow':>8} {'Pool sat':>8}"
+    )
+
+    for endpoint, endpoint_stats in sorted(stats.items(), key=lambda item: -len(item[1].latencies)):
+        latencies = [latency * 1000 for latency in endpoint_stats.latencies]
+        pool_max = max(endpoint_stats.pool_checked_out, default=None)
+        overflow_max = max(endpoint_stats.pool_overflow, default=None)
+        pool_saturated = (
+            f"{endpoint_stats.pool_saturated / len(endpoint_stats.pool_checked_out):.0%}"
+            if endpoint_stats.pool_checked_out
+            else "n/a"
+        )
+        print(
+            f"{endpoint:<40} {len(latencies):>7} {endpoint_stats.errors:>7} {endpoint_stats.client_errors:>7} "
+            f"{percentile(latencies, 50):>8.1f} {percentile(latencies, 90):>8.1f} {percentile(latencies, 99):>8.1f} "
+            f"{max(latencies):>8.1f} {percentile(endpoint_stats.lags, 99) * 1000:>8.1f} "
+            f"{pool_max if pool_max is not None else 'n/a':>8} {overflow_max if overflow_max is not None else 'n/a':>8} "
+            f"{pool_saturated:>8}"
+        )
+
+
+def main() -> None:
+    """Main entry point for the load replay tool."""
+    # Parse command line arguments
+    parser = argparse.ArgumentParser(description="Beamtime Load Replay")
+    parser.add_argument("logs", nargs="*", type=Path, default=[Path("logs/flask.log")], help="Access log files. Default is logs/flask.log.")
+    parser.add_argument("-u", "--url", default="http://127.0.0.1:5000", help="Base URL of the instance. Default is http://127.0.0.1:5000.")
+    parser.add_argument("-s", "--speedup", type=float, default=1.0, help="Replay speed-up factor. Default is 1.")
+    parser.add_argument("-c", "--concurrency", type=int, default=16, help="Maximum concurrent requests. Default is 16.")
+    parser.add_argument("-f", "--filter", help="Only replay request paths matching this regular expression.")
+    parser.add_argument("-l", "--limit", type=int, help="Maximum number of requests to replay.")
+    parser.add_argument("--include-writes", action="store_true", help="Also replay requests that modify the database.")
+    parser.add_argument("--post-body", nargs=2, action="append", default=[], metavar=("PATH", "JSON"), help="JSON body sent with the POST requests to PATH.")
+    args = parser.parse_args()
+
+    # Select the records to replay
+    records = [
+        record
+        for record in parse_access_log(args.logs)
+        if (args.include_writes or record.path.split("?", 1)[0] not in WRITE_ENDPOINTS)
+        and (not args.filter or re.search(args.filter, record.path))
+    ][: args.limit]
+
+    if not records:
+        print("No access records to replay.")
+        return
+
+    duration = (records[-1].timestamp - records[0].timestamp) / args.speedup
+    print(f"Replaying {len(records)} requests over {duration:.1f}s against {args.url}")
+
+    post_bodies = {path: json.loads(body) for path, body in args.post_body}
+    print_report(
+        LoadReplay(args.url, speedup=args.speedup, concurrency=args.concurrency, post_bodies=post_bodies).run(records)
+    )
+
+
+if __name__ == "__main__":
+    main()
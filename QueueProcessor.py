@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+# ----------------------------------------------------------------------------------
+# Project: BeamtimeApp
+# File: QueueProcessor.py
+# ----------------------------------------------------------------------------------
+# Purpose:
+# This is the entry point for the queue processor. This file is used to create the
+# user folders for the pending queue rows.
+# ----------------------------------------------------------------------------------
+# Author: Christofanis Skordas
+#
+# Copyright (C) 2025 GSECARS, The University of Chicago, USA
+# Copyright (C) 2025 NSF SEES, USA
+# ----------------------------------------------------------------------------------
+
+import argparse
+from pathlib import Path
+from typing import Any
+
+from beamtime_app.queue_processor import QueueProcessor
+
+
+def print_progress(completed: int, total: int, status: dict[str, Any]) -> None:
+    """Prints the progress of the queue processor."""
+    print(f"[{completed}/{total}] Queue row {status['id']} {status['status']}: {status['status_message']}")
+
+
+def main() -> None:
+    """Main entry point for the queue processor."""
+    # Parse command line arguments
+    parser = argparse.ArgumentParser(description="Beamtime Queue Processor")
+    parser.add_argument("-r", "--root", type=Path, help="Create all folders relative to this directory.")
+    parser.add_argument("-w", "--workers", type=int, default=8, help="Number of parallel workers. Default is 8.")
+    parser.add_argument("--retries", type=int, default=3, help="Attempts per queue row. Default is 3.")
+    parser.add_argument("-l", "--limit", type=int, help="Maximum number of queue rows to process.")
+    parser.add_argument("--retry-failed", action="store_true", help="Also process the queue rows that failed before.")
+    args = parser.parse_args()
+
+    # Process the pending queue rows
+    processor = QueueProcessor(root=args.root, workers=args.workers, retries=args.retries, progress=print_progress)
+    result = processor.run(limit=args.limit, retry_failed=args.retry_failed)
+    print(f"Processed {result['success']} queue rows, {result['failure']} failed.")
+
+
+if __name__ == "__main__":
+    main()
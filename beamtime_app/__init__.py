@@ -17,7 +17,7 @@ import logging
 from logging.handlers import RotatingFileHandler
 from pathlib import Path
 
-from flask import Flask
+from flask import Flask, g, has_request_context
 
 from beamtime_app.config import Config, DatabaseConfig
 
@@ -54,4 +54,35 @@ def create_flask_app(config_class=Config):
     app.register_blueprint(beamtime)
     app.register_blueprint(api_v1)
 
+    # Warm up each worker process in the background from its first request, /ready reports
+    # when it is done. Starting here would only warm up the gunicorn master under --preload
+    if app.config["WARMUP"]:
+        from beamtime_app.warmup import WARMUP
+
+        @app.before_request
+        def start_warmup():
+            WARMUP.start(app)
+
+    # Report the database pool usage on every response, used by LoadReplay.py. The session
+    # has returned its connection by the time the response is built, so the peak usage seen
+    # while the request checked out connections is reported
+    if app.config["POOL_STATUS_HEADERS"]:
+        from sqlalchemy import event
+
+        from beamtime_app.database import ENGINE
+
+        @event.listens_for(ENGINE, "checkout")
+        def record_pool_usage(dbapi_connection, connection_record, connection_proxy):
+            if has_request_context():
+                g.pool_checked_out = max(g.get("pool_checked_out", 0), ENGINE.pool.checkedout())
+                g.pool_overflow = max(g.get("pool_overflow", 0), ENGINE.pool.overflow())
+
+        @app.after_request
+        def add_pool_status_headers(response):
+            response.headers["X-DB-Pool-Size"] = str(ENGINE.pool.size())
+            response.headers["X-DB-Pool-Max-Overflow"] = str(database_config.max_overflow)
+            response.headers["X-DB-Pool-Checked-Out"] = str(g.get("pool_checked_out", ENGINE.pool.checkedout()))
+            response.headers["X-DB-Pool-Overflow"] = str(g.get("pool_overflow", max(ENGINE.pool.overflow(), 0)))
+            return response
+
     return app
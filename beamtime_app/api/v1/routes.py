@@ -12,20 +12,61 @@
 # Copyright (C) 2025 NSF SEES, USA
 # ----------------------------------------------------------------------------------
 
-from flask import Blueprint, flash, jsonify, render_template, request
+import dataclasses
+import datetime
+from typing import Any, Iterator
+
+from flask import Blueprint, Response, flash, jsonify, request, stream_template
 
 from beamtime_app.crud import (
     add_to_queue,
+    export_experiments,
+    export_queue,
     get_all_entries,
     get_data_path,
-    get_experiments,
+    get_data_path_entry,
+    get_experiment_runs,
+    get_queue_by_acknowledgment,
+    iter_experiments,
+    search_experiments,
+)
+from beamtime_app.models import Acknowledgment, BaseModel, Beamline, Info, Run, Station, Technique
+from beamtime_app.utils import (
+    STREAM_FLUSH,
+    SingleFlight,
+    buffer_chunks,
+    compile_path_template,
+    expand_path_template,
+    format_info_modification_time,
+    normalize_datapath,
+    run_number,
+    stream_csv,
+    stream_ndjson,
+    validate_and_normalize_datapath,
 )
-from beamtime_app.models import Acknowledgment, Beamline, Info, Run, Station, Technique
-from beamtime_app.utils import format_info_modification_time
 
 # Create a Blueprint for the beamtime routes
 api_v1 = Blueprint("api_v1", __name__, url_prefix="/api/v1")
 
+# Share in-flight and just finished path validations between concurrent requests
+path_validations = SingleFlight(ttl=1.0)
+
+# Maximum number of experiments expanded in a single request
+MAX_EXPAND_EXPERIMENTS = 1000
+
+# Maximum number of experiments returned by a search
+MAX_SEARCH_RESULTS = 100
+
+
+def _lazy_entries(model: BaseModel) -> Iterator[dict[str, Any]]:
+    """Defers reading the entries of a model until the streamed template reaches them."""
+    yield from get_all_entries(model)
+
+
+def _last_modified() -> str | None:
+    """Returns the info table modification time, called by the streamed template when it is reached."""
+    return format_info_modification_time(get_all_entries(Info))
+
 
 @api_v1.route("/")
 def home():
@@ -33,20 +74,28 @@ def home():
     selected_beamline = request.args.get("beamline", type=int)
     selected_station = request.args.get("station", type=int)
     selected_technique = request.args.get("technique", type=int)
-    experiments = get_experiments(run=selected_run, beamline=selected_beamline)
-    return render_template(
-        "index.html",
-        beamlines=get_all_entries(Beamline),
-        stations=get_all_entries(Station),
-        techniques=get_all_entries(Technique),
-        runs=get_all_entries(Run),
-        experiments=experiments,
-        acknowledgments=get_all_entries(Acknowledgment),
-        last_modified=format_info_modification_time(get_all_entries(Info)),
-        selected_run=selected_run,
-        selected_beamline=selected_beamline,
-        selected_station=selected_station,
-        selected_technique=selected_technique,
+
+    # Stream the page so the layout is sent before any query runs, each query runs when the
+    # template reaches the section that needs it
+    return Response(
+        buffer_chunks(
+            stream_template(
+                "index.html",
+                beamlines=_lazy_entries(Beamline),
+                stations=_lazy_entries(Station),
+                techniques=_lazy_entries(Technique),
+                runs=_lazy_entries(Run),
+                experiments=iter_experiments(run=selected_run, beamline=selected_beamline),
+                acknowledgments=_lazy_entries(Acknowledgment),
+                last_modified=_last_modified,
+                flush=STREAM_FLUSH,
+                selected_run=selected_run,
+                selected_beamline=selected_beamline,
+                selected_station=selected_station,
+                selected_technique=selected_technique,
+            )
+        ),
+        mimetype="text/html",
     )
 
 
@@ -57,6 +106,20 @@ def get_acknowledgments() -> str:
     return jsonify(acknowledgments)
 
 
+@api_v1.route("/search", methods=["GET"])
+def search_api():
+    """API endpoint to search the experiments by title, user folder and proposal."""
+    query = request.args.get("q", "")
+    limit = max(1, min(request.args.get("limit", 20, type=int), MAX_SEARCH_RESULTS))
+
+    if not query.strip():
+        return jsonify([])
+
+    return jsonify(
+        [dataclasses.asdict(record) | {"score": round(score, 3)} for record, score in search_experiments(query, limit)]
+    )
+
+
 @api_v1.route("/get_data_path", methods=["GET"])
 def get_data_path_api():
     """API endpoint to fetch data path template."""
@@ -70,6 +133,91 @@ def get_data_path_api():
     return template
 
 
+def parse_expand_request(data: Any) -> tuple[int, int, list[int]]:
+    """Parses the expand request, raising ValueError with the error message if it is invalid."""
+    if not isinstance(data, dict):
+        raise ValueError("The request body must be a JSON object")
+
+    station_id = data.get("station_id")
+    technique_id = data.get("technique_id")
+    experiment_ids = data.get("experiment_ids")
+
+    if not station_id or not technique_id or not isinstance(experiment_ids, list):
+        raise ValueError("station_id, technique_id and experiment_ids are required")
+
+    try:
+        station_id = int(station_id)
+        technique_id = int(technique_id)
+        experiment_ids = [int(experiment_id) for experiment_id in experiment_ids]
+    except (TypeError, ValueError):
+        raise ValueError("station_id, technique_id and experiment_ids must be integers")
+
+    if len(experiment_ids) > MAX_EXPAND_EXPERIMENTS:
+        raise ValueError(f"At most {MAX_EXPAND_EXPERIMENTS} experiments can be expanded at once")
+
+    return station_id, technique_id, experiment_ids
+
+
+def expand_paths(entry: tuple[int, str], runs: dict[int, str], experiment_ids: list[int]) -> dict[int, str]:
+    """Expands the data path template for each known experiment."""
+    compiled = compile_path_template(*entry)
+    year = str(datetime.date.today().year)
+
+    return {
+        experiment_id: normalize_datapath(expand_path_template(compiled, {"YEAR": year, "RUN": run_number(runs[experiment_id])}))
+        for experiment_id in experiment_ids
+        if experiment_id in runs
+    }
+
+
+def expand_response(
+    entry: tuple[int, str], experiment_ids: list[int], data_paths: dict[int, str], validations: dict[str, dict[str, Any]]
+) -> Response:
+    """Builds the expand response from the expanded paths and their validations."""
+    paths = []
+    for experiment_id in experiment_ids:
+        if experiment_id not in data_paths:
+            paths.append({"experiment_id": experiment_id, "data_path": "", "valid": False, "exists": False, "message": "Unknown experiment"})
+            continue
+
+        data_path = data_paths[experiment_id]
+        result = validations[data_path]
+        paths.append(
+            {
+                "experiment_id": experiment_id,
+                "data_path": data_path,
+                "valid": result["valid"],
+                "exists": result["exists"],
+                "message": result["message"],
+            }
+        )
+
+    return jsonify({"template": entry[1], "paths": paths})
+
+
+@api_v1.route("/expand_data_paths", methods=["POST"])
+def expand_data_paths_api():
+    """API endpoint to expand and validate the data path template for many experiments."""
+    try:
+        station_id, technique_id, experiment_ids = parse_expand_request(request.get_json(silent=True) or {})
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    entry = get_data_path_entry(station_id, technique_id)
+    if entry is None:
+        return jsonify({"template": "", "paths": []})
+
+    data_paths = expand_paths(entry, get_experiment_runs(experiment_ids), experiment_ids)
+
+    # Experiments of the same run usually share a path, so validate each path once
+    validations = {
+        data_path: path_validations.do(data_path, validate_and_normalize_datapath, data_path)
+        for data_path in set(data_paths.values())
+    }
+
+    return expand_response(entry, experiment_ids, data_paths, validations)
+
+
 @api_v1.route("/create_update_queue", methods=["POST"])
 def create_update_queue() -> str:
     """Handles adding rows to the queue table."""
@@ -111,13 +259,20 @@ def create_update_queue() -> str:
     return jsonify(result)
 
 
+@api_v1.route("/get_queue", methods=["GET"])
+def get_queue_api():
+    """API endpoint to fetch the queue rows that cite an acknowledgment."""
+    acknowledgment_id = request.args.get("acknowledgment_id", type=int)
+
+    if not acknowledgment_id:
+        return jsonify({"error": "acknowledgment_id is required"}), 400
+
+    return jsonify(get_queue_by_acknowledgment(acknowledgment_id))
+
+
 @api_v1.route("/validate_data_path", methods=["POST"])
 def validate_data_path_api():
     """API endpoint to validate if a data path is valid."""
-    from flask import jsonify, request
-
-    from beamtime_app.utils import validate_and_normalize_datapath
-
     data = request.get_json()
     if not data or "path" not in data:
         return jsonify({"error": "Path is required"}), 400
@@ -127,7 +282,7 @@ def validate_data_path_api():
         return jsonify({"exists": False, "valid": False, "message": "Empty path"})
 
     try:
-        result = validate_and_normalize_datapath(path)
+        result = path_validations.do(path, validate_and_normalize_datapath, path)
         return jsonify(
             {
                 "exists": result["exists"],
@@ -138,3 +293,60 @@ def validate_data_path_api():
         )
     except Exception as e:
         return jsonify({"error": f"Error validating path: {str(e)}"}), 500
+
+
+def _prefetched_rows(first: dict[str, Any] | None, rows: Iterator[dict[str, Any]]) -> Iterator[dict[str, Any]]:
+    """Yields the prefetched first row followed by the remaining rows, closing them afterwards."""
+    try:
+        if first is not None:
+            yield first
+            yield from rows
+    finally:
+        rows.close()
+
+
+def _export_response(
+    name: str, columns: list[str], rows: Iterator[dict[str, Any]]
+) -> Response | tuple[Response, int]:
+    """Builds a streamed CSV or NDJSON export response based on the format argument."""
+    export_format = request.args.get("format", "csv").lower()
+
+    if export_format not in ("csv", "ndjson"):
+        rows.close()
+        return jsonify({"error": "Format must be csv or ndjson"}), 400
+
+    # Read the first row before the response starts, so a failing query is still reported as
+    # an error instead of a 200 with a truncated body
+    try:
+        first = next(rows, None)
+    except Exception as e:
+        rows.close()
+        print(f"Error exporting {name}: {e}")
+        return jsonify({"error": f"Error exporting {name}: {str(e)}"}), 500
+
+    rows = _prefetched_rows(first, rows)
+    if export_format == "csv":
+        body, mimetype = stream_csv(columns, rows), "text/csv"
+    else:
+        body, mimetype = stream_ndjson(rows), "application/x-ndjson"
+
+    run = request.args.get("run", type=int)
+    filename = f"{name}_run_{run}.{export_format}" if run else f"{name}.{export_format}"
+    return Response(body, mimetype=mimetype, headers={"Content-Disposition": f"attachment; filename={filename}"})
+
+
+@api_v1.route("/export/experiments", methods=["GET"])
+def export_experiments_api() -> Response | tuple[Response, int]:
+    """API endpoint to stream the experiments with their process status."""
+    columns, rows = export_experiments(
+        run=request.args.get("run", type=int),
+        beamline=request.args.get("beamline", type=int),
+    )
+    return _export_response("experiments", columns, rows)
+
+
+@api_v1.route("/export/queue", methods=["GET"])
+def export_queue_api() -> Response | tuple[Response, int]:
+    """API endpoint to stream the queue rows."""
+    columns, rows = export_queue(run=request.args.get("run", type=int))
+    return _export_response("queue", columns, rows)
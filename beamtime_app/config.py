@@ -33,6 +33,8 @@ class Config:
     """A class that includes the configuration settings for Flask."""
 
     SECRET_KEY = os.getenv("SECRET_KEY")
+    POOL_STATUS_HEADERS = os.getenv("POOL_STATUS_HEADERS", "false").lower() == "true"
+    WARMUP = os.getenv("WARMUP", "true").lower() == "true"
 
 
 @dataclass
@@ -40,10 +42,40 @@ class DatabaseConfig:
     """A class that provides the configuration settings for the database."""
 
     _database_uri: str | None = field(init=False, compare=False, repr=False)
+    _pool_size: int = field(init=False, compare=False, repr=False)
+    _max_overflow: int = field(init=False, compare=False, repr=False)
+    _experiment_sync_interval: float = field(init=False, compare=False, repr=False)
+    _experiment_reload_interval: float = field(init=False, compare=False, repr=False)
+    _warmup_connections: int = field(init=False, compare=False, repr=False)
 
     def __post_init__(self) -> None:
         self._database_uri = os.getenv("DATABASE_URI")
+        self._pool_size = int(os.getenv("DATABASE_POOL_SIZE", "10"))
+        self._max_overflow = int(os.getenv("DATABASE_MAX_OVERFLOW", "2"))
+        self._experiment_sync_interval = float(os.getenv("EXPERIMENT_SYNC_INTERVAL", "5"))
+        self._experiment_reload_interval = float(os.getenv("EXPERIMENT_RELOAD_INTERVAL", "300"))
+        self._warmup_connections = int(os.getenv("WARMUP_CONNECTIONS", "4"))
 
     @property
     def database_uri(self) -> str | None:
         return self._database_uri
+
+    @property
+    def pool_size(self) -> int:
+        return self._pool_size
+
+    @property
+    def max_overflow(self) -> int:
+        return self._max_overflow
+
+    @property
+    def experiment_sync_interval(self) -> float:
+        return self._experiment_sync_interval
+
+    @property
+    def experiment_reload_interval(self) -> float:
+        return self._experiment_reload_interval
+
+    @property
+    def warmup_connections(self) -> int:
+        return self._warmup_connections
@@ -11,17 +11,52 @@
 # Copyright (C) 2025 NSF SEES, USA
 # ----------------------------------------------------------------------------------
 
-from typing import Any
+from typing import Any, Iterable, Iterator
 
-from sqlalchemy import insert
+from sqlalchemy import Row, Select, Text, case, cast, func, insert, or_, text, update
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.future import select
 from sqlalchemy.orm import Session
 
-from beamtime_app.database import DBException, session_scope
-from beamtime_app.models import BaseModel, DataPath, Experiment, ProcessStatus, Queue
-from beamtime_app.utils import format_experiment_data, to_dictionary
+from beamtime_app.database import ENGINE, DBException, session_scope
+from beamtime_app.models import (
+    Acknowledgment,
+    BaseModel,
+    DataPath,
+    Experiment,
+    ProcessStatus,
+    Queue,
+    QueueAcknowledgment,
+    QueueStatus,
+    Run,
+)
+from beamtime_app.read_model import EXPERIMENTS, ExperimentRecord
+from beamtime_app.search import EXACT_SCORE, PREFIX_SCORE, SEARCH_INDEX, SIMILARITY_THRESHOLD, SUBSTRING_SCORE
+from beamtime_app.utils import to_dictionary
 
-__all__ = ["add_to_queue", "get_all_entries"]
+__all__ = [
+    "add_to_queue",
+    "export_experiments",
+    "export_queue",
+    "get_all_entries",
+    "get_data_path_entry",
+    "get_experiment_runs",
+    "get_pending_queue",
+    "get_queue_acknowledgments",
+    "get_queue_by_acknowledgment",
+    "iter_experiments",
+    "search_experiments",
+    "search_results",
+    "search_statement",
+    "set_queue_status",
+    "trigram_search_available",
+]
+
+# Number of rows fetched per round trip when streaming exports
+EXPORT_BATCH_SIZE = 500
+
+# Whether the database provides pg_trgm, None until the first search checks it
+_trigram_search_available: bool | None = None
 
 
 def _select_all(db: Session, model: BaseModel) -> list[BaseModel]:
@@ -43,86 +78,284 @@ def get_all_entries(model: BaseModel) -> list[dict[str, Any]]:
     return entries
 
 
-def get_experiments(
-    run: int | None = None, beamline: int | None = None
-) -> list[dict[str, any]]:
-    """Gets experiments with joined process status names."""
-    experiments = []
+def get_experiments(run: int | None = None, beamline: int | None = None) -> list[ExperimentRecord]:
+    """Gets experiments with joined process status names from the in-memory read model."""
+    return EXPERIMENTS.query(run=run, beamline=beamline)
 
-    with session_scope() as session:
+
+def iter_experiments(run: int | None = None, beamline: int | None = None) -> Iterator[ExperimentRecord]:
+    """Lazily yields the experiments from the in-memory read model, used for streamed rendering."""
+    return EXPERIMENTS.iter_query(run=run, beamline=beamline)
+
+
+def _parse_acknowledgments(value: Any) -> list[int]:
+    """Parses acknowledgment ids given as a list or a comma-separated string."""
+    if not value or value == "N/A":
+        return []
+
+    items = value.split(",") if isinstance(value, str) else value
+    acknowledgments = []
+    for item in items:
         try:
-            # Join Experiment with ProcessStatus to get status names
-            query = session.query(
-                Experiment.id,
-                Experiment.title,
-                Experiment.run_id,
-                Experiment.beamline_id,
-                Experiment.proposal_id,
-                Experiment.user_folder,
-                ProcessStatus.name.label("process_status_name"),
-            ).outerjoin(ProcessStatus, Experiment.process_status_id == ProcessStatus.id)
-
-            results = query.all()
-
-            # Convert results to dictionaries
-            experiments = [
-                {
-                    "id": result.id,
-                    "title": result.title,
-                    "run_id": result.run_id,
-                    "beamline_id": result.beamline_id,
-                    "proposal_id": result.proposal_id,
-                    "user_folder": result.user_folder,
-                    "process_status": result.process_status_name or "Unknown",
-                }
-                for result in results
-            ]
+            acknowledgment_id = int(str(item).strip())
+        except ValueError:
+            continue
+        if acknowledgment_id not in acknowledgments:
+            acknowledgments.append(acknowledgment_id)
 
-        except DBException as e:
-            print(f"Error getting experiments: {e}")
+    return acknowledgments
 
-    # Apply filters
-    if beamline:
-        experiments = [exp for exp in experiments if exp["beamline_id"] == beamline]
-    if run:
-        experiments = [exp for exp in experiments if exp["run_id"] == run]
 
-    # Format the data using the existing formatter
-    return format_experiment_data(experiments)
+def _escape_like(value: str) -> str:
+    """Escapes the LIKE wildcards in a value."""
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def search_statement(query: str, limit: int) -> Select:
+    """
+    Builds the ranked experiment search statement using the Postgres pg_trgm operators.
+
+    The scoring matches the in-process index in search.py, the proposal number only
+    matches exactly or by prefix, never by similarity.
+    """
+    escaped = _escape_like(query)
+    proposal = cast(Experiment.proposal_id, Text)
+
+    def text_score(column):
+        return case(
+            (func.lower(column) == query.lower(), EXACT_SCORE),
+            (column.ilike(f"{escaped}%", escape="\\"), PREFIX_SCORE),
+            (column.ilike(f"%{escaped}%", escape="\\"), SUBSTRING_SCORE),
+            else_=func.coalesce(func.similarity(column, query), 0.0),
+        )
+
+    score = func.greatest(
+        text_score(Experiment.title),
+        text_score(Experiment.user_folder),
+        case((proposal == query, EXACT_SCORE), (proposal.like(f"{escaped}%", escape="\\"), PREFIX_SCORE), else_=0.0),
+    ).label("score")
+
+    return (
+        select(
+            Experiment.id,
+            Experiment.title,
+            Experiment.run_id,
+            Experiment.beamline_id,
+            Experiment.proposal_id,
+            ProcessStatus.name,
+            Experiment.user_folder,
+            score,
+        )
+        .outerjoin(ProcessStatus, Experiment.process_status_id == ProcessStatus.id)
+        .where(
+            or_(
+                Experiment.title.ilike(f"%{escaped}%", escape="\\"),
+                Experiment.title.bool_op("%")(query),
+                Experiment.user_folder.ilike(f"%{escaped}%", escape="\\"),
+                Experiment.user_folder.bool_op("%")(query),
+                proposal.like(f"{escaped}%", escape="\\"),
+            )
+        )
+        .order_by(score.desc(), Experiment.id)
+        .limit(limit)
+    )
+
+
+def search_results(rows: Iterable[Row]) -> list[tuple[ExperimentRecord, float]]:
+    """Converts the search statement rows into records with their scores."""
+    return [
+        (ExperimentRecord(row[0], row[1], row[2], row[3], row[4], row[5] or "Unknown", row[6]), float(row[7]))
+        for row in rows
+        if row[7] >= SIMILARITY_THRESHOLD
+    ]
+
+
+def _search_experiments_trigram(query: str, limit: int) -> list[tuple[ExperimentRecord, float]]:
+    """Searches the experiments using the Postgres pg_trgm indexes."""
+    with session_scope() as session:
+        return search_results(session.execute(search_statement(query, limit)))
+
+
+def trigram_search_available() -> bool:
+    """Returns whether the database provides the pg_trgm extension, checked once per process."""
+    global _trigram_search_available
+    if _trigram_search_available is not None:
+        return _trigram_search_available
+
+    if ENGINE.dialect.name != "postgresql":
+        _trigram_search_available = False
+        return False
+
+    try:
+        with session_scope() as session:
+            _trigram_search_available = bool(
+                session.scalar(text("SELECT EXISTS (SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm')"))
+            )
+    except (DBException, SQLAlchemyError) as e:
+        # Not cached, so the check is repeated once the database is reachable again
+        print(f"Error checking for pg_trgm: {e}")
+        return False
+
+    if not _trigram_search_available:
+        print("pg_trgm is not installed, searching the experiments with the in-process index.")
+
+    return _trigram_search_available
+
+
+def search_experiments(query: str, limit: int = 20) -> list[tuple[ExperimentRecord, float]]:
+    """
+    Searches the experiments by title, user folder and proposal, best matches first.
+
+    Postgres uses the pg_trgm indexes, other databases (or a Postgres without the
+    extension) fall back to the in-process trigram index.
+    """
+    query = query.strip()
+    if not query:
+        return []
+
+    if trigram_search_available():
+        try:
+            return _search_experiments_trigram(query, limit)
+        except (DBException, SQLAlchemyError) as e:
+            print(f"Error searching experiments, using the in-process index: {e}")
+
+    return SEARCH_INDEX.search(query, limit)
 
 
 def add_to_queue(rows: list[dict[str, Any]]) -> dict[str, int]:
-    """Adds multiple rows to the queue table."""
+    """
+    Adds multiple rows to the queue table along with their acknowledgments.
+
+    Rows citing an unknown acknowledgment are counted as failures and skipped, the
+    other rows are still added. The acknowledgment ids are also written to the legacy
+    queue.acknowledgments column as a comma-separated string.
+    """
     success_count = 0
     failure_count = 0
 
-    # Convert "N/A" values to None and handle acknowledgments as a comma-separated string
+    # Convert "N/A" values to None and split off the acknowledgments
     sanitized_rows = [
-        {
-            key: (
-                None
-                if value == "N/A"
-                else ",".join(map(str, value))
-                if key == "acknowledgments" and isinstance(value, list)
-                else value
-            )
-            for key, value in row.items()
-        }
+        {key: None if value == "N/A" else value for key, value in row.items() if key != "acknowledgments"}
         for row in rows
     ]
+    acknowledgments = [_parse_acknowledgments(row.get("acknowledgments")) for row in rows]
+
+    if not sanitized_rows:
+        return {"success": 0, "failure": 0}
 
     with session_scope() as session:
         try:
-            session.execute(insert(Queue), sanitized_rows)
+            # Skip the rows citing acknowledgments that do not exist, instead of failing the batch
+            cited = set().union(*acknowledgments)
+            known = set(session.scalars(select(Acknowledgment.id).where(Acknowledgment.id.in_(cited))))
+            valid = [
+                (row | {"acknowledgments": ",".join(map(str, acknowledgment_ids))}, acknowledgment_ids)
+                for row, acknowledgment_ids in zip(sanitized_rows, acknowledgments)
+                if known.issuperset(acknowledgment_ids)
+            ]
+            failure_count = len(sanitized_rows) - len(valid)
+            if failure_count:
+                print(f"Skipped {failure_count} queue rows citing unknown acknowledgments")
+
+            if valid:
+                # Insert the queue rows and bulk insert their acknowledgments in the same transaction
+                queue_ids = session.scalars(
+                    insert(Queue).returning(Queue.id, sort_by_parameter_order=True), [row for row, _ in valid]
+                ).all()
+                links = [
+                    {"queue_id": queue_id, "acknowledgment_id": acknowledgment_id}
+                    for queue_id, (_, acknowledgment_ids) in zip(queue_ids, valid)
+                    for acknowledgment_id in acknowledgment_ids
+                ]
+                if links:
+                    session.execute(insert(QueueAcknowledgment), links)
+
             session.commit()
-            success_count = len(sanitized_rows)
+            success_count = len(valid)
         except Exception as e:
+            session.rollback()
             print(f"Failed to add rows to queue: {e}")
             failure_count = len(sanitized_rows)
 
     return {"success": success_count, "failure": failure_count}
 
 
+def get_queue_acknowledgments(queue_ids: list[int]) -> dict[int, list[int]]:
+    """Returns the acknowledgment ids of each of the given queue rows."""
+    acknowledgments = {queue_id: [] for queue_id in queue_ids}
+
+    with session_scope() as session:
+        try:
+            results = session.execute(
+                select(QueueAcknowledgment.queue_id, QueueAcknowledgment.acknowledgment_id)
+                .where(QueueAcknowledgment.queue_id.in_(queue_ids))
+                .order_by(QueueAcknowledgment.queue_id, QueueAcknowledgment.acknowledgment_id)
+            )
+            for result in results:
+                acknowledgments[result.queue_id].append(result.acknowledgment_id)
+
+        except DBException as e:
+            print(f"Error retrieving queue acknowledgments: {e}")
+
+    return acknowledgments
+
+
+def get_queue_by_acknowledgment(acknowledgment_id: int) -> list[dict[str, Any]]:
+    """Returns the queue rows that cite the given acknowledgment, with their acknowledgment ids."""
+    entries = []
+
+    with session_scope() as session:
+        try:
+            statement = (
+                select(Queue)
+                .join(QueueAcknowledgment, QueueAcknowledgment.queue_id == Queue.id)
+                .where(QueueAcknowledgment.acknowledgment_id == acknowledgment_id)
+                .order_by(Queue.id)
+            )
+            entries = [to_dictionary(entry) for entry in session.execute(statement).scalars()]
+
+        except DBException as e:
+            print(f"Error retrieving queue rows: {e}")
+
+    acknowledgments = get_queue_acknowledgments([entry["id"] for entry in entries])
+    for entry in entries:
+        entry["acknowledgments"] = acknowledgments[entry["id"]]
+
+    return entries
+
+
+def get_pending_queue(limit: int | None = None, include_failed: bool = False) -> list[dict[str, Any]]:
+    """Returns the queue rows that have not been processed yet, and optionally the failed ones."""
+    entries = []
+    statuses = [Queue.status.is_(None), Queue.status == QueueStatus.PENDING]
+    if include_failed:
+        statuses.append(Queue.status == QueueStatus.FAILED)
+
+    with session_scope() as session:
+        try:
+            statement = select(Queue).where(or_(*statuses)).order_by(Queue.id)
+            if limit:
+                statement = statement.limit(limit)
+
+            entries = [to_dictionary(entry) for entry in session.execute(statement).scalars()]
+        except DBException as e:
+            print(f"Error getting pending queue rows: {e}")
+
+    return entries
+
+
+def set_queue_status(statuses: list[dict[str, Any]]) -> None:
+    """Bulk updates the status of queue rows given as dictionaries with id, status and status_message."""
+    if not statuses:
+        return
+
+    with session_scope() as session:
+        try:
+            session.execute(update(Queue), statuses)
+        except DBException as e:
+            print(f"Error updating queue status: {e}")
+
+
 def get_data_path(station_id: int, technique_id: int) -> str:
     """Returns data path template string for a given station and technique."""
     with session_scope() as session:
@@ -142,3 +375,106 @@ def get_data_path(station_id: int, technique_id: int) -> str:
         except DBException as e:
             print(f"Error retrieving data path: {e}")
             return ""
+
+
+def get_data_path_entry(station_id: int, technique_id: int) -> tuple[int, str] | None:
+    """Returns the data path id and template for a given station and technique."""
+    with session_scope() as session:
+        try:
+            result = session.execute(
+                select(DataPath.id, DataPath.path_template).where(
+                    DataPath.station_id == station_id,
+                    DataPath.technique_id == technique_id,
+                )
+            ).first()
+            return (result.id, result.path_template or "") if result else None
+
+        except DBException as e:
+            print(f"Error retrieving data path: {e}")
+            return None
+
+
+def get_experiment_runs(experiment_ids: list[int]) -> dict[int, str]:
+    """Returns the run name of each of the given experiments."""
+    runs = {}
+
+    with session_scope() as session:
+        try:
+            results = session.execute(
+                select(Experiment.id, Run.name)
+                .outerjoin(Run, Experiment.run_id == Run.id)
+                .where(Experiment.id.in_(experiment_ids))
+            )
+            runs = {result.id: result.name or "" for result in results}
+
+        except DBException as e:
+            print(f"Error retrieving experiment runs: {e}")
+
+    return runs
+
+
+def _stream_rows(statement: Select) -> Iterator[dict[str, Any]]:
+    """Streams the rows of a statement through a server-side cursor."""
+    with session_scope() as session:
+        try:
+            result = session.execute(statement, execution_options={"yield_per": EXPORT_BATCH_SIZE})
+            for row in result.mappings():
+                yield dict(row)
+        except DBException as e:
+            print(f"Error streaming rows: {e}")
+
+
+def export_experiments(
+    run: int | None = None, beamline: int | None = None
+) -> tuple[list[str], Iterator[dict[str, Any]]]:
+    """Returns the export columns and a lazy row iterator for the experiments."""
+    statement = (
+        select(
+            Experiment.id,
+            Experiment.title,
+            Experiment.run_id,
+            Experiment.beamline_id,
+            Experiment.proposal_id,
+            Experiment.user_folder,
+            ProcessStatus.name.label("process_status"),
+        )
+        .outerjoin(ProcessStatus, Experiment.process_status_id == ProcessStatus.id)
+        .order_by(Experiment.id)
+    )
+
+    if run:
+        statement = statement.where(Experiment.run_id == run)
+    if beamline:
+        statement = statement.where(Experiment.beamline_id == beamline)
+
+    return list(statement.selected_columns.keys()), _stream_rows(statement)
+
+
+def _split_acknowledgments(rows: Iterator[dict[str, Any]]) -> Iterator[dict[str, Any]]:
+    """Converts the aggregated acknowledgment ids of streamed queue rows to lists."""
+    try:
+        for row in rows:
+            row["acknowledgments"] = _parse_acknowledgments(row["acknowledgments"])
+            yield row
+    finally:
+        rows.close()
+
+
+def export_queue(run: int | None = None) -> tuple[list[str], Iterator[dict[str, Any]]]:
+    """Returns the export columns and a lazy row iterator for the queue."""
+    acknowledgments = (
+        select(func.aggregate_strings(cast(QueueAcknowledgment.acknowledgment_id, Text), ","))
+        .where(QueueAcknowledgment.queue_id == Queue.id)
+        .scalar_subquery()
+        .label("acknowledgments")
+    )
+    columns = [column for column in Queue.__table__.columns if column.key != "acknowledgments"]
+    statement = select(*columns, acknowledgments).order_by(Queue.id)
+
+    # The queue only references experiments by number, so filter runs through the experiment table
+    if run:
+        statement = statement.where(
+            Queue.experiment_number.in_(select(Experiment.id).where(Experiment.run_id == run))
+        )
+
+    return list(statement.selected_columns.keys()), _split_acknowledgments(_stream_rows(statement))
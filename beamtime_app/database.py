@@ -12,6 +12,7 @@
 # Copyright (C) 2025 NSF SEES, USA
 # ----------------------------------------------------------------------------------
 
+import os
 from contextlib import contextmanager
 
 from sqlalchemy import create_engine
@@ -25,9 +26,18 @@ __all__ = ["BASE", "session_scope", "DBException"]
 
 
 # Create the database engine and session
-ENGINE = create_engine(database_config.database_uri, pool_size=10, max_overflow=2, pool_timeout=30)
+ENGINE = create_engine(
+    database_config.database_uri,
+    pool_size=database_config.pool_size,
+    max_overflow=database_config.max_overflow,
+    pool_timeout=30,
+)
 SESSION = scoped_session(sessionmaker(autocommit=False, autoflush=False, bind=ENGINE))
 
+# Forked workers must not reuse the pooled connections of their parent, drop them without
+# closing them so the parent's connections stay usable
+os.register_at_fork(after_in_child=lambda: ENGINE.dispose(close=False))
+
 # Create the base class for the database models
 BASE = declarative_base()
 
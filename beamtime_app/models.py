@@ -14,14 +14,15 @@
 
 import datetime
 from dataclasses import dataclass, field
+from enum import StrEnum
 from typing import Any, Dict
 
-from sqlalchemy import DateTime, ForeignKey, Integer, String, Text
+from sqlalchemy import DateTime, ForeignKey, Integer, String, Text, func
 from sqlalchemy.orm import Mapped, mapped_column
 
 from beamtime_app.database import BASE
 
-__all__ = ["Acknowledgment", "Beamline", "DataPath", "Experiment", "Info", "Person", "ProcessStatus", "Queue", "Run", "Station", "Technique"]
+__all__ = ["Acknowledgment", "Beamline", "DataPath", "Experiment", "ExperimentDeletion", "Info", "Person", "ProcessStatus", "Queue", "QueueAcknowledgment", "QueueStatus", "Run", "Station", "Technique"]
 
 
 class BaseModel:
@@ -176,6 +177,7 @@ class Experiment(BASE, BaseModel):
     proposal_pdf_file: Mapped[str] = mapped_column(Text)
     folder_status_id: Mapped[int] = mapped_column(Integer)
     process_status_id: Mapped[int] = mapped_column(Integer)
+    updated_at: Mapped[datetime.datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), index=True)
 
     def __post_init__(self) -> None:
         self._columns = {
@@ -198,9 +200,23 @@ class Experiment(BASE, BaseModel):
             "proposal_pdf_file": self.proposal_pdf_file,
             "folder_status_id": self.folder_status_id,
             "process_status": self.process_status,
+            "updated_at": self.updated_at,
         }
 
 
+@dataclass
+class ExperimentDeletion(BASE, BaseModel):
+    """Model for the deleted experiment ids, recorded by a database trigger."""
+
+    __tablename__ = "experiment_deletion"
+
+    experiment_id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    deleted_at: Mapped[datetime.datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), index=True)
+
+    def __post_init__(self) -> None:
+        self._columns = {"experiment_id": self.experiment_id, "deleted_at": self.deleted_at}
+
+
 @dataclass
 class ProcessStatus(BASE, BaseModel):
     """Model for the process status."""
@@ -214,6 +230,14 @@ class ProcessStatus(BASE, BaseModel):
         self._columns = {"id": self.id, "name": self.name}
 
 
+class QueueStatus(StrEnum):
+    """Processing states of a queue row. Rows without a status are pending."""
+
+    PENDING = "pending"
+    DONE = "done"
+    FAILED = "failed"
+
+
 @dataclass
 class Queue(BASE, BaseModel):
     """Model for the queue."""
@@ -227,7 +251,10 @@ class Queue(BASE, BaseModel):
     pvlog_path: Mapped[str] = mapped_column(Text)
     doi: Mapped[bool] = mapped_column()
     proposal_number: Mapped[int] = mapped_column(Integer)
+    # Legacy comma-separated acknowledgment ids, still written for the readers of the column
     acknowledgments: Mapped[str] = mapped_column(Text)
+    status: Mapped[str] = mapped_column(Text, nullable=True, index=True)
+    status_message: Mapped[str] = mapped_column(Text, nullable=True)
 
     def __post_init__(self) -> None:
         self._columns = {
@@ -239,8 +266,24 @@ class Queue(BASE, BaseModel):
             "doi": self.doi,
             "proposal_number": self.proposal_number,
             "acknowledgments": self.acknowledgments,
+            "status": self.status,
+            "status_message": self.status_message,
         }
 
+
+@dataclass
+class QueueAcknowledgment(BASE, BaseModel):
+    """Model for the acknowledgments cited by the queue rows."""
+
+    __tablename__ = "queue_acknowledgment"
+
+    queue_id: Mapped[int] = mapped_column(Integer, ForeignKey("queue.id", ondelete="CASCADE"), primary_key=True)
+    acknowledgment_id: Mapped[int] = mapped_column(Integer, ForeignKey("acknowledgment.id"), primary_key=True, index=True)
+
+    def __post_init__(self) -> None:
+        self._columns = {"queue_id": self.queue_id, "acknowledgment_id": self.acknowledgment_id}
+
+
 @dataclass
 class DataPath(BASE, BaseModel):
     """Model for the data paths."""
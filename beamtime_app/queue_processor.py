@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+# ----------------------------------------------------------------------------------
+# Project: BeamtimeApp
+# File: beamtime_app/queue_processor.py
+# ----------------------------------------------------------------------------------
+# Purpose:
+# This file is used to process the queue rows and create the user folders.
+# ----------------------------------------------------------------------------------
+# Author: Christofanis Skordas
+#
+# Copyright (C) 2025 GSECARS, The University of Chicago, USA
+# Copyright (C) 2025 NSF SEES, USA
+# ----------------------------------------------------------------------------------
+
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import Any, Callable
+
+from beamtime_app.crud import get_pending_queue, set_queue_status
+from beamtime_app.models import QueueStatus
+from beamtime_app.utils import normalize_datapath, validate_datapath
+
+__all__ = ["QueueProcessor"]
+
+
+# Number of processed rows written back to the database at once
+STATUS_BATCH_SIZE = 50
+
+
+class QueueProcessor:
+    """
+    Drains the pending queue rows and creates their data and PVLogger folders.
+
+    Rows are processed in parallel on a bounded thread pool. Folder creation is
+    idempotent, so rows can safely be processed again, and transient filesystem errors
+    are retried with an exponential backoff before a row is marked as failed. When a
+    root directory is given, all paths are created relative to it.
+    """
+
+    def __init__(
+        self,
+        root: Path | None = None,
+        workers: int = 8,
+        retries: int = 3,
+        retry_delay: float = 1.0,
+        progress: Callable[[int, int, dict[str, Any]], None] | None = None,
+    ) -> None:
+        self._root = root.resolve() if root is not None else None
+        self._workers = workers
+        self._retries = max(retries, 1)
+        self._retry_delay = retry_delay
+        self._progress = progress
+
+    def run(self, limit: int | None = None, retry_failed: bool = False) -> dict[str, int]:
+        """Processes the pending (and optionally failed) queue rows and returns the success and failure counts."""
+        rows = get_pending_queue(limit, include_failed=retry_failed)
+        summary = {"success": 0, "failure": 0}
+        statuses = []
+
+        with ThreadPoolExecutor(max_workers=self._workers) as executor:
+            futures = [executor.submit(self.process_row, row) for row in rows]
+
+            for completed, future in enumerate(as_completed(futures), start=1):
+                status = future.result()
+                summary["success" if status["status"] == QueueStatus.DONE else "failure"] += 1
+
+                # Write the statuses back in batches so progress survives an interruption
+                statuses.append(status)
+                if len(statuses) >= STATUS_BATCH_SIZE:
+                    set_queue_status(statuses)
+                    statuses = []
+
+                if self._progress:
+                    self._progress(completed, len(rows), status)
+
+        set_queue_status(statuses)
+
+        return summary
+
+    def process_row(self, row: dict[str, Any]) -> dict[str, Any]:
+        """Creates the folders of a single queue row and returns its new status."""
+        paths = [row[key] for key in ("data_path", "pvlog_path") if row.get(key)]
+        if not paths:
+            return self._status(row, QueueStatus.DONE, "No folders to create")
+
+        try:
+            targets = [self.resolve_path(path) for path in paths]
+        except ValueError as e:
+            return self._status(row, QueueStatus.FAILED, str(e))
+
+        for attempt in range(1, self._retries + 1):
+            try:
+                for target in targets:
+                    target.mkdir(parents=True, exist_ok=True)
+                return self._status(row, QueueStatus.DONE, f"Created {', '.join(str(target) for target in targets)}")
+            except (FileExistsError, NotADirectoryError) as e:
+                # A file is in the way, retrying will not help
+                return self._status(row, QueueStatus.FAILED, str(e))
+            except OSError as e:
+                if attempt == self._retries:
+                    return self._status(row, QueueStatus.FAILED, f"Failed after {attempt} attempts: {e}")
+                time.sleep(self._retry_delay * 2 ** (attempt - 1))
+
+    def resolve_path(self, datapath: str) -> Path:
+        """Validates a queue path and resolves it against the root directory."""
+        if not validate_datapath(datapath):
+            raise ValueError(f"Invalid path: {datapath}")
+
+        normalized = normalize_datapath(datapath)
+        if self._root is None:
+            if not Path(normalized).is_absolute():
+                raise ValueError(f"Path must be absolute: {datapath}")
+            return Path(normalized)
+
+        # Strip any drive letter and leading separators, then keep the path inside the root
+        relative = re.sub(r"^[A-Za-z]:", "", normalized).lstrip("/")
+        target = (self._root / relative).resolve()
+        if not target.is_relative_to(self._root):
+            raise ValueError(f"Path escapes the root directory: {datapath}")
+
+        return target
+
+    @staticmethod
+    def _status(row: dict[str, Any], status: QueueStatus, message: str) -> dict[str, Any]:
+        """Builds the status update for a queue row."""
+        return {"id": row["id"], "status": status, "status_message": message}
@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+# ----------------------------------------------------------------------------------
+# Project: BeamtimeApp
+# File: beamtime_app/read_model.py
+# ----------------------------------------------------------------------------------
+# Purpose:
+# This file is used to keep an in-process read model of the experiment listing.
+# ----------------------------------------------------------------------------------
+# Author: Christofanis Skordas
+#
+# Copyright (C) 2025 GSECARS, The University of Chicago, USA
+# Copyright (C) 2025 NSF SEES, USA
+# ----------------------------------------------------------------------------------
+
+import datetime
+import threading
+import time
+from dataclasses import dataclass, field, replace
+from typing import Iterable, Iterator
+
+from sqlalchemy import ColumnElement, func
+from sqlalchemy.future import select
+from sqlalchemy.orm import Session
+
+from beamtime_app import database_config
+from beamtime_app.database import DBException, session_scope
+from beamtime_app.models import Experiment, ExperimentDeletion, ProcessStatus
+
+__all__ = ["EXPERIMENTS", "ExperimentReadModel", "ExperimentRecord"]
+
+
+# Changes are read again for this long after a sync, so rows written by transactions that
+# commit after the sync, with an earlier modification time, are still picked up
+CHANGE_OVERLAP = datetime.timedelta(seconds=60)
+
+
+@dataclass(frozen=True, slots=True)
+class ExperimentRecord:
+    """A projected experiment row as shown in the experiment listing."""
+
+    id: int
+    title: str | None
+    run_id: int | None
+    beamline_id: int | None
+    proposal: int | None
+    process_status: str
+    user_folder: str | None
+
+
+@dataclass(frozen=True, slots=True)
+class _Snapshot:
+    """An immutable view of the read model, swapped atomically on every sync."""
+
+    records: tuple[ExperimentRecord, ...] = ()
+    by_id: dict[int, ExperimentRecord] = field(default_factory=dict)
+    by_run: dict[int, tuple[ExperimentRecord, ...]] = field(default_factory=dict)
+    by_beamline: dict[int, tuple[ExperimentRecord, ...]] = field(default_factory=dict)
+    synced_at: datetime.datetime | None = None
+    checked_at: float = float("-inf")
+    loaded_at: float = float("-inf")
+
+    @classmethod
+    def build(
+        cls, by_id: dict[int, ExperimentRecord], synced_at: datetime.datetime, loaded_at: float, checked_at: float
+    ) -> "_Snapshot":
+        """Builds a snapshot with its ordered records and indexes from the records by id."""
+        records = tuple(by_id[experiment_id] for experiment_id in sorted(by_id))
+        return cls(
+            records=records,
+            by_id=by_id,
+            by_run=_group_by(records, "run_id"),
+            by_beamline=_group_by(records, "beamline_id"),
+            synced_at=synced_at,
+            checked_at=checked_at,
+            loaded_at=loaded_at,
+        )
+
+
+def _select_records(db: Session, condition: ColumnElement[bool] | None = None) -> list[ExperimentRecord]:
+    """Returns the projected experiment rows, only those matching the condition if given."""
+    statement = (
+        select(
+            Experiment.id,
+            Experiment.title,
+            Experiment.run_id,
+            Experiment.beamline_id,
+            Experiment.proposal_id,
+            ProcessStatus.name,
+            Experiment.user_folder,
+        )
+        .outerjoin(ProcessStatus, Experiment.process_status_id == ProcessStatus.id)
+        .order_by(Experiment.id)
+    )
+    if condition is not None:
+        statement = statement.where(condition)
+
+    return [
+        ExperimentRecord(row[0], row[1], row[2], row[3], row[4], row[5] or "Unknown", row[6])
+        for row in db.execute(statement)
+    ]
+
+
+def _group_by(records: Iterable[ExperimentRecord], attribute: str) -> dict[int, tuple[ExperimentRecord, ...]]:
+    """Groups records by the given attribute, keeping their order."""
+    grouped: dict[int, list[ExperimentRecord]] = {}
+    for record in records:
+        grouped.setdefault(getattr(record, attribute), []).append(record)
+
+    return {key: tuple(value) for key, value in grouped.items()}
+
+
+class ExperimentReadModel:
+    """
+    In-memory read model of the experiment listing with run and beamline indexes.
+
+    Every sync fetches only the experiments whose updated_at changed and the ids
+    recorded in experiment_deletion since the previous sync, both maintained by
+    database triggers. A full reload is still forced every reload_interval seconds,
+    which picks up renamed process statuses.
+    """
+
+    def __init__(self, sync_interval: float = 5.0, reload_interval: float = 300.0) -> None:
+        self._sync_interval = sync_interval
+        self._reload_interval = reload_interval
+        self._snapshot = _Snapshot()
+        self._lock = threading.Lock()
+
+    def query(self, run: int | None = None, beamline: int | None = None) -> list[ExperimentRecord]:
+        """Returns the experiments, optionally filtered by run and beamline."""
+        return list(self.iter_query(run=run, beamline=beamline))
+
+    def iter_query(self, run: int | None = None, beamline: int | None = None) -> Iterator[ExperimentRecord]:
+        """Lazily yields the experiments, optionally filtered by run and beamline, syncing on the first row."""
+        self.sync()
+        snapshot = self._snapshot
+
+        if run and beamline:
+            by_run = snapshot.by_run.get(run, ())
+            by_beamline = snapshot.by_beamline.get(beamline, ())
+            if len(by_run) <= len(by_beamline):
+                yield from (record for record in by_run if record.beamline_id == beamline)
+            else:
+                yield from (record for record in by_beamline if record.run_id == run)
+        elif run:
+            yield from snapshot.by_run.get(run, ())
+        elif beamline:
+            yield from snapshot.by_beamline.get(beamline, ())
+        else:
+            yield from snapshot.records
+
+    def records(self) -> tuple[ExperimentRecord, ...]:
+        """Returns all experiments as the immutable tuple of the current snapshot."""
+        self.sync()
+        return self._snapshot.records
+
+    def invalidate(self) -> None:
+        """Forces a full reload on the next access."""
+        with self._lock:
+            self._snapshot = replace(self._snapshot, checked_at=float("-inf"), loaded_at=float("-inf"))
+
+    def sync(self) -> None:
+        """Brings the read model up to date if the sync interval has passed."""
+        if time.monotonic() - self._snapshot.checked_at < self._sync_interval:
+            return
+
+        # Serve the current snapshot while another thread syncs, unless nothing is loaded yet
+        loaded = self._snapshot.loaded_at != float("-inf")
+        if not self._lock.acquire(blocking=not loaded):
+            return
+
+        try:
+            if time.monotonic() - self._snapshot.checked_at >= self._sync_interval:
+                self._sync()
+        finally:
+            self._lock.release()
+
+    def _sync(self) -> None:
+        """Reloads the snapshot, or applies the experiments changed and deleted since the last sync."""
+        snapshot = self._snapshot
+        now = time.monotonic()
+
+        with session_scope() as session:
+            try:
+                synced_at = session.scalar(select(func.now()))
+
+                if snapshot.synced_at is None or now - snapshot.loaded_at >= self._reload_interval:
+                    by_id = {record.id: record for record in _select_records(session)}
+                    snapshot = _Snapshot.build(by_id, synced_at, loaded_at=now, checked_at=now)
+                else:
+                    since = snapshot.synced_at - CHANGE_OVERLAP
+                    deleted = session.scalars(
+                        select(ExperimentDeletion.experiment_id).where(ExperimentDeletion.deleted_at > since)
+                    ).all()
+                    changed = _select_records(session, Experiment.updated_at > since)
+                    snapshot = self._apply(snapshot, changed, deleted, synced_at, now)
+
+            except DBException as e:
+                print(f"Error syncing experiments: {e}")
+                return
+
+        self._snapshot = snapshot
+
+    @staticmethod
+    def _apply(
+        snapshot: _Snapshot,
+        changed: list[ExperimentRecord],
+        deleted: Iterable[int],
+        synced_at: datetime.datetime,
+        now: float,
+    ) -> _Snapshot:
+        """Applies the changed and deleted experiments, keeping the snapshot if none of them differ."""
+        # Rows read again within the overlap are usually unchanged, so compare before rebuilding
+        changed_ids = {record.id for record in changed}
+        deleted = [
+            experiment_id
+            for experiment_id in deleted
+            if experiment_id in snapshot.by_id and experiment_id not in changed_ids
+        ]
+        changed = [record for record in changed if snapshot.by_id.get(record.id) != record]
+
+        if not changed and not deleted:
+            return replace(snapshot, synced_at=synced_at, checked_at=now)
+
+        by_id = dict(snapshot.by_id)
+        for experiment_id in deleted:
+            del by_id[experiment_id]
+        for record in changed:
+            by_id[record.id] = record
+
+        return _Snapshot.build(by_id, synced_at, loaded_at=snapshot.loaded_at, checked_at=now)
+
+
+# Process wide read model used by the API
+EXPERIMENTS = ExperimentReadModel(
+    sync_interval=database_config.experiment_sync_interval,
+    reload_interval=database_config.experiment_reload_interval,
+)
@@ -12,7 +12,9 @@
 # Copyright (C) 2025 NSF SEES, USA
 # ----------------------------------------------------------------------------------
 
-from flask import Blueprint, redirect, request, url_for
+from flask import Blueprint, current_app, jsonify, redirect, request, url_for
+
+from beamtime_app.warmup import WARMUP
 
 beamtime = Blueprint("beamtime", __name__)
 
@@ -21,3 +23,13 @@ beamtime = Blueprint("beamtime", __name__)
 def home():
     # Forward all query parameters to /api/v1/
     return redirect(url_for("api_v1.home", **request.args))
+
+
+@beamtime.route("/ready")
+def ready():
+    """Reports whether the worker has finished warming up, with the duration of each phase."""
+    if not current_app.config["WARMUP"]:
+        return jsonify({"ready": True, "phases": {}, "total": 0.0, "error": None})
+
+    status = WARMUP.status()
+    return jsonify(status), 200 if status["ready"] else 503
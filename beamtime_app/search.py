@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+# ----------------------------------------------------------------------------------
+# Project: BeamtimeApp
+# File: beamtime_app/search.py
+# ----------------------------------------------------------------------------------
+# Purpose:
+# This file is used to define the in-process experiment search index, used when the
+# database does not provide trigram indexes.
+# ----------------------------------------------------------------------------------
+# Author: Christofanis Skordas
+#
+# Copyright (C) 2025 GSECARS, The University of Chicago, USA
+# Copyright (C) 2025 NSF SEES, USA
+# ----------------------------------------------------------------------------------
+
+import heapq
+import threading
+from dataclasses import dataclass
+
+from beamtime_app.read_model import EXPERIMENTS, ExperimentReadModel, ExperimentRecord
+
+__all__ = ["SEARCH_INDEX", "ExperimentSearchIndex", "trigrams"]
+
+
+# Minimum trigram similarity for fuzzy matches, the pg_trgm default
+SIMILARITY_THRESHOLD = 0.3
+
+# Scores of exact, prefix and substring matches, above any fuzzy match
+EXACT_SCORE = 3.0
+PREFIX_SCORE = 2.0
+SUBSTRING_SCORE = 1.5
+
+
+def trigrams(text: str) -> frozenset[str]:
+    """Returns the trigrams of a lowercased, padded string, similar to pg_trgm."""
+    padded = f"  {text.lower()} "
+    return frozenset(padded[index : index + 3] for index in range(len(padded) - 2))
+
+
+@dataclass(frozen=True, slots=True)
+class _Index:
+    """An immutable index over a read model snapshot, with the lowercased text fields and their trigrams."""
+
+    records: tuple[ExperimentRecord, ...]
+    fields: tuple[tuple[tuple[str, frozenset[str]], ...], ...]
+    proposals: tuple[str | None, ...]
+
+
+class ExperimentSearchIndex:
+    """
+    In-process search over the experiment title, user folder and proposal.
+
+    Every experiment of the read model is scored, the index only caches the lowercased
+    fields and their trigrams and is rebuilt whenever the read model publishes a new
+    snapshot. The scoring matches the pg_trgm search in crud.py: the title and user
+    folder rank exact first, then prefix, then substring, then by trigram similarity,
+    the proposal number only matches exactly or by prefix.
+    """
+
+    def __init__(self, read_model: ExperimentReadModel) -> None:
+        self._read_model = read_model
+        self._index = _Index((), (), ())
+        self._lock = threading.Lock()
+
+    def search(self, query: str, limit: int = 20) -> list[tuple[ExperimentRecord, float]]:
+        """Returns the best matching experiments with their scores."""
+        query = query.strip().lower()
+        if not query:
+            return []
+
+        index = self._current_index()
+        query_trigrams = trigrams(query)
+
+        results = []
+        for record, fields, proposal in zip(index.records, index.fields, index.proposals):
+            score = max(
+                (self._score(query, query_trigrams, field, field_trigrams) for field, field_trigrams in fields),
+                default=0.0,
+            )
+            if proposal is not None:
+                score = max(score, self._score_proposal(query, proposal))
+            if score >= SIMILARITY_THRESHOLD:
+                results.append((record, score))
+
+        return heapq.nsmallest(limit, results, key=lambda result: (-result[1], result[0].id))
+
+    def prime(self) -> None:
+        """Builds the index ahead of the first search."""
+        self._current_index()
+
+    def _current_index(self) -> _Index:
+        """Returns the index, rebuilding it if the read model snapshot changed."""
+        records = self._read_model.records()
+        if records is self._index.records:
+            return self._index
+
+        with self._lock:
+            if records is not self._index.records:
+                self._index = self._build(records)
+            return self._index
+
+    @staticmethod
+    def _build(records: tuple[ExperimentRecord, ...]) -> _Index:
+        """Precomputes the lowercased text fields and their trigrams for the given records."""
+        fields = tuple(
+            tuple((value.lower(), trigrams(value)) for value in (record.title, record.user_folder) if value is not None)
+            for record in records
+        )
+        proposals = tuple(str(record.proposal) if record.proposal is not None else None for record in records)
+
+        return _Index(records, fields, proposals)
+
+    @staticmethod
+    def _score(query: str, query_trigrams: frozenset[str], field: str, field_trigrams: frozenset[str]) -> float:
+        """Scores a text field against the query."""
+        if field == query:
+            return EXACT_SCORE
+        if field.startswith(query):
+            return PREFIX_SCORE
+        if query in field:
+            return SUBSTRING_SCORE
+
+        return len(query_trigrams & field_trigrams) / len(query_trigrams | field_trigrams)
+
+    @staticmethod
+    def _score_proposal(query: str, proposal: str) -> float:
+        """Scores the proposal number against the query, only exact and prefix matches count."""
+        if proposal == query:
+            return EXACT_SCORE
+        if proposal.startswith(query):
+            return PREFIX_SCORE
+        return 0.0
+
+
+# Process wide search index used by the API
+SEARCH_INDEX = ExperimentSearchIndex(EXPERIMENTS)
@@ -14,6 +14,14 @@
 let acknowledgmentOptions = [];
 let dataPathTemplate = '';
 
+// Rows rendered above and below the visible window of a virtualized table
+const VIRTUAL_OVERSCAN = 10;
+// Fallback row height in pixels until a rendered row can be measured
+const VIRTUAL_DEFAULT_ROW_HEIGHT = 45;
+
+// In-memory row models backing the available and selected tables
+const tableModels = {};
+
 // Fetch acknowledgment options from the server
 function fetchAcknowledgmentOptions() {
     fetch('/api/v1/get_acknowledgments')
@@ -50,19 +58,224 @@ function fetchAcknowledgmentOptions() {
         .catch(error => console.error('Error fetching acknowledgment options:', error));
 }
 
-// Toggle all checkboxes in a table
-function toggleSelectAll(tableId, checked) {
-    const tableBody = document.getElementById(tableId);
-    if (tableBody) {
-        tableBody.querySelectorAll('.select-experiment').forEach(checkbox => {
-            checkbox.checked = checked;
+// Escape a value before interpolating it into HTML
+function escapeHtml(value) {
+    return String(value ?? '')
+        .replace(/&/g, '&amp;')
+        .replace(/</g, '&lt;')
+        .replace(/>/g, '&gt;')
+        .replace(/"/g, '&quot;')
+        .replace(/'/g, '&#39;');
+}
+
+// Create the row model for a virtualized table body
+function createTableModel(tableId, columnCount, renderRow) {
+    return {
+        tableId,
+        columnCount,
+        renderRow,
+        rows: [],
+        checkedCount: 0,
+        rowHeight: 0,
+        windowStart: -1,
+        windowEnd: -1
+    };
+}
+
+// Build an available table row from an experiment record
+function createAvailableRow(record) {
+    const [id, title, runId, beamlineId, proposal, status, userFolder] = record;
+    return {
+        checked: false,
+        id,
+        title: title ?? '',
+        runId: runId ?? '',
+        beamlineId: beamlineId ?? '',
+        proposal: proposal ?? 'N/A',
+        status: status ?? 'N/A',
+        userFolder: userFolder ?? ''
+    };
+}
+
+// Build a selected table row, optionally from an available table row
+function createSelectedRow(source = null, dataPath = '') {
+    return {
+        checked: true,
+        source,
+        title: source ? source.title : '',
+        dataPath,
+        pvlogPath: '',
+        acknowledgments: [],
+        doi: true,
+        experiment: source ? String(source.id) : '',
+        proposal: source ? String(source.proposal) : '',
+        status: source ? source.status : 'New'
+    };
+}
+
+// Render a single available table row
+function renderAvailableRow(row, index) {
+    return `
+        <tr class="experiment-row" data-index="${index}">
+            <td>
+                <input type="checkbox" class="select-experiment"
+                       name="selected_experiments"
+                       value="${escapeHtml(row.id)}" ${row.checked ? 'checked' : ''}>
+            </td>
+            <td>${escapeHtml(row.title)}</td>
+            <td>${escapeHtml(row.id)}</td>
+            <td>${escapeHtml(row.proposal)}</td>
+            <td>${escapeHtml(row.status)}</td>
+        </tr>`;
+}
+
+// Render a single selected table row
+function renderSelectedRow(row, index) {
+    const acknowledgmentsLabel = row.acknowledgments.length > 0
+        ? row.acknowledgments.length + ' acknowledgment(s) selected'
+        : '';
+
+    return `
+        <tr data-index="${index}">
+            <td><input type="checkbox" class="select-experiment" ${row.checked ? 'checked' : ''}></td>
+            <td><input type="text" class="form-control" data-field="title" value="${escapeHtml(row.title)}" placeholder="Title"></td>
+            <td><input type="text" class="form-control editable-data-path" data-field="dataPath" value="${escapeHtml(row.dataPath)}" style="width: 100%;"></td>
+            <td><input type="text" class="form-control editable-pvlogger-path" data-field="pvlogPath" value="${escapeHtml(row.pvlogPath)}" style="width: 100%;"></td>
+            <td>
+                <input type="text" class="form-control editable-acknowledgments" readonly placeholder="Click to add acknowledgments" value="${escapeHtml(acknowledgmentsLabel)}">
+                <div class="acknowledgments-tooltip"></div>
+            </td>
+            <td><input type="checkbox" class="doi-checkbox" data-field="doi" ${row.doi ? 'checked' : ''}></td>
+            <td><input type="text" class="form-control" data-field="experiment" value="${escapeHtml(row.experiment)}" placeholder="Experiment"></td>
+            <td><input type="text" class="form-control" data-field="proposal" value="${escapeHtml(row.proposal)}" placeholder="Proposal"></td>
+            <td>${escapeHtml(row.status)}</td>
+        </tr>`;
+}
+
+// Render the visible window of a table, padding the rest with spacer rows
+function renderTable(model, force = true) {
+    const tableBody = document.getElementById(model.tableId);
+    if (!tableBody) return;
+
+    // Re-rendering on scroll would replace the input the user is typing in
+    const focused = document.activeElement;
+    if (!force && focused && focused.tagName === 'INPUT' && tableBody.contains(focused)) return;
+
+    const container = tableBody.closest('.table-responsive') || tableBody.parentElement;
+    const table = tableBody.closest('table');
+    const headerHeight = table && table.tHead ? table.tHead.offsetHeight : 0;
+    const rowHeight = model.rowHeight || VIRTUAL_DEFAULT_ROW_HEIGHT;
+    const viewportHeight = container.clientHeight || 400;
+    const windowSize = Math.ceil(viewportHeight / rowHeight) + 2 * VIRTUAL_OVERSCAN;
+    const windowStart = Math.max(0, Math.min(
+        Math.floor(Math.max(0, container.scrollTop - headerHeight) / rowHeight) - VIRTUAL_OVERSCAN,
+        model.rows.length - windowSize
+    ));
+    const windowEnd = Math.min(model.rows.length, windowStart + windowSize);
+
+    // Skip the render if scrolling did not move the window
+    if (!force && windowStart === model.windowStart && windowEnd === model.windowEnd) return;
+    model.windowStart = windowStart;
+    model.windowEnd = windowEnd;
+
+    const spacer = height => height > 0
+        ? `<tr class="virtual-spacer"><td colspan="${model.columnCount}" style="height: ${height}px;"></td></tr>`
+        : '';
+
+    const html = [spacer(windowStart * rowHeight)];
+    for (let index = windowStart; index < windowEnd; index++) {
+        html.push(model.renderRow(model.rows[index], index));
+    }
+    html.push(spacer((model.rows.length - windowEnd) * rowHeight));
+    tableBody.innerHTML = html.join('');
+
+    // Measure the real row height once a row has been rendered
+    if (!model.rowHeight && windowEnd > windowStart) {
+        const firstRow = tableBody.querySelector('tr[data-index]');
+        const measured = firstRow ? firstRow.getBoundingClientRect().height : 0;
+        if (measured > 0) {
+            model.rowHeight = measured;
+            renderTable(model);
+        }
+    }
+}
+
+// Re-render a table on scroll, at most once per animation frame
+function initializeVirtualScroll(model) {
+    const tableBody = document.getElementById(model.tableId);
+    if (!tableBody) return;
+
+    const container = tableBody.closest('.table-responsive') || tableBody.parentElement;
+    let framePending = false;
+    const scheduleRender = () => {
+        if (framePending) return;
+        framePending = true;
+        requestAnimationFrame(() => {
+            framePending = false;
+            renderTable(model, false);
         });
+    };
+
+    container.addEventListener('scroll', scheduleRender);
+    // Catch up with scrolling that happened while an input had focus
+    tableBody.addEventListener('focusout', scheduleRender);
+}
+
+// Look up the model row behind a table element
+function getModelRow(model, element) {
+    const tr = element.closest('tr[data-index]');
+    return tr ? model.rows[Number(tr.dataset.index)] : null;
+}
+
+// Set the checked state of a row and keep the checked count in sync
+function setRowChecked(model, row, checked) {
+    if (row.checked === checked) return;
+    row.checked = checked;
+    model.checkedCount += checked ? 1 : -1;
+}
+
+// Replace the rows of a table model and recount the checked rows
+function setModelRows(model, rows) {
+    model.rows = rows;
+    model.checkedCount = rows.reduce((count, row) => count + (row.checked ? 1 : 0), 0);
+}
+
+// Load the available experiments embedded in the page
+function initializeTableModels() {
+    tableModels.availableTableBody = createTableModel('availableTableBody', 5, renderAvailableRow);
+    tableModels.selectedTableBody = createTableModel('selectedTableBody', 9, renderSelectedRow);
+
+    const experimentsData = document.getElementById('experimentsData');
+    if (experimentsData) {
+        try {
+            setModelRows(tableModels.availableTableBody, JSON.parse(experimentsData.textContent).map(createAvailableRow));
+        } catch (error) {
+            console.error('Error loading experiments:', error);
+        }
     }
+
+    Object.values(tableModels).forEach(model => {
+        initializeVirtualScroll(model);
+        renderTable(model);
+    });
+}
+
+// Toggle all checkboxes in a table
+function toggleSelectAll(tableId, checked) {
+    const model = tableModels[tableId];
+    if (!model) return;
+
+    model.rows.forEach(row => {
+        row.checked = checked;
+    });
+    model.checkedCount = checked ? model.rows.length : 0;
+    renderTable(model);
 }
 
 // Update badge counts for delete and create/update buttons
 function updateBadges() {
-    const selectedCount = document.querySelectorAll('#selectedTableBody .select-experiment:checked').length;
+    const selectedModel = tableModels.selectedTableBody;
+    const selectedCount = selectedModel ? selectedModel.checkedCount : 0;
     const deleteCount = document.getElementById('deleteCount');
     const createUpdateCount = document.getElementById('createUpdateCount');
 
@@ -80,110 +293,77 @@ function updateBadges() {
 
 // Delete selected rows from the table
 function deleteSelectedRows() {
-    const selectedTableBody = document.getElementById('selectedTableBody');
-    if (!selectedTableBody) return;
-
-    const checkboxes = selectedTableBody.querySelectorAll('.select-experiment:checked');
-    checkboxes.forEach(checkbox => {
-        checkbox.closest('tr').remove();
-    });
+    const model = tableModels.selectedTableBody;
+    if (!model) return;
 
+    setModelRows(model, model.rows.filter(row => !row.checked));
+    renderTable(model);
     updateBadges();
 }
 
 // Move rows between tables
 function moveRows(sourceTableId, targetTableId) {
-    const sourceTableBody = document.getElementById(sourceTableId);
-    const targetTableBody = document.getElementById(targetTableId);
-    if (!sourceTableBody || !targetTableBody) return;
+    const sourceModel = tableModels[sourceTableId];
+    const targetModel = tableModels[targetTableId];
+    if (!sourceModel || !targetModel || sourceModel.checkedCount === 0) return;
 
-    const selectedRows = Array.from(sourceTableBody.querySelectorAll('.select-experiment:checked'));
-    
-    // If moving to selected table, ensure we have the current data path template
+    // If moving to selected table, expand the data paths of all moved rows in one request
     if (targetTableId === 'selectedTableBody') {
-        ensureDataPathTemplate().then(() => {
-            processRowMove();
+        const experimentIds = sourceModel.rows.filter(row => row.checked).map(row => row.id);
+        expandDataPaths(experimentIds).then(expandedPaths => {
+            processRowMove(expandedPaths);
         }).catch(() => {
-            // Proceed without template if fetch fails
+            // Proceed with the locally formatted paths if the expansion fails
             processRowMove();
         });
     } else {
         processRowMove();
     }
 
-    function processRowMove() {
-        selectedRows.forEach(checkbox => {
-            const row = checkbox.closest('tr');
-            
-            if (targetTableId === 'availableTableBody') {
-                // Only move back rows that came from the available table
-                // Check if the status is "New" which indicates it was manually created
-                const status = row.querySelector('td:nth-child(9)').textContent.trim();
-                if (status === 'New') {
-                    // Skip moving manually created rows
+    function processRowMove(expandedPaths = new Map()) {
+        const remainingRows = [];
+        const movedRows = [];
+
+        sourceModel.rows.forEach(row => {
+            if (!row.checked) {
+                remainingRows.push(row);
+            } else if (targetTableId === 'availableTableBody') {
+                // Only move back rows that came from the available table, skip manually created rows
+                if (row.status === 'New' || !row.source) {
+                    remainingRows.push(row);
                     return;
                 }
 
-                // Moving back to available table - restore original format
-                const title = row.querySelector('td:nth-child(2) input').value.trim();
-                const experimentId = row.querySelector('td:nth-child(7) input').value.trim();
-                const proposal = row.querySelector('td:nth-child(8) input').value.trim();
-                const userFolder = row.querySelector('td:nth-child(3) input').value.trim();
-
-                const newRow = document.createElement('tr');
-                newRow.className = 'experiment-row';
-                newRow.dataset.userFolder = userFolder;
-                newRow.innerHTML = `
-                    <td>
-                        <input type="checkbox" class="select-experiment" 
-                               name="selected_experiments" 
-                               value="${experimentId}">
-                    </td>
-                    <td>${title}</td>
-                    <td>${experimentId}</td>
-                    <td>${proposal}</td>
-                    <td>${status}</td>
-                `;
-                targetTableBody.appendChild(newRow);
-                row.remove();
+                // Moving back to available table - restore the original record with the user's edits
+                movedRows.push({
+                    ...row.source,
+                    checked: false,
+                    id: row.experiment.trim() || row.source.id,
+                    title: row.title.trim(),
+                    proposal: row.proposal.trim(),
+                    userFolder: row.dataPath.trim()
+                });
             } else {
-                // Moving to selected table - convert to editable format
-                const title = row.querySelector('td:nth-child(2)').textContent.trim();
-                const experimentId = row.querySelector('td:nth-child(3)').textContent.trim();
-                const proposal = row.querySelector('td:nth-child(4)').textContent.trim();
-                const status = row.querySelector('td:nth-child(5)').textContent.trim();
-                const userFolder = row.dataset.userFolder || '';
-                const runId = row.dataset.run || '';
-
                 // Extract run number from runId (e.g., "2025-1" -> "1")
+                const runId = String(row.runId);
                 const runNumber = runId.includes('-') ? runId.split('-').pop() : runId;
 
-                // Use template path with run number context
-                const formattedDataPath = dataPathTemplate ? 
-                    formatDataPath(dataPathTemplate, { runId: runNumber }) : 
-                    userFolder;
-
-                const newRow = document.createElement('tr');
-                newRow.innerHTML = `
-                    <td><input type="checkbox" class="select-experiment" checked></td>
-                    <td><input type="text" class="form-control" value="${title}" placeholder="Title"></td>
-                    <td><input type="text" class="form-control editable-data-path" value="${formattedDataPath}" style="width: 100%;"></td>
-                    <td><input type="text" class="form-control editable-pvlogger-path" value="" style="width: 100%;"></td>
-                    <td>
-                        <input type="text" class="form-control editable-acknowledgments" readonly placeholder="Click to add acknowledgments">
-                        <div class="acknowledgments-tooltip"></div>
-                        <input type="hidden" class="acknowledgments-data">
-                    </td>
-                    <td><input type="checkbox" class="doi-checkbox" checked></td>
-                    <td><input type="text" class="form-control" value="${experimentId}" placeholder="Experiment"></td>
-                    <td><input type="text" class="form-control" value="${proposal}" placeholder="Proposal"></td>
-                    <td>${status}</td>
-                `;
-                targetTableBody.appendChild(newRow);
-                row.remove();
+                // Prefer the server expanded path, then the template path with run number context
+                const expandedPath = expandedPaths.get(row.id);
+                const formattedDataPath = expandedPath && expandedPath.data_path ?
+                    expandedPath.data_path :
+                    dataPathTemplate ?
+                        formatDataPath(dataPathTemplate, { runId: runNumber }) :
+                        row.userFolder;
+
+                movedRows.push(createSelectedRow(row, formattedDataPath));
             }
         });
 
+        setModelRows(sourceModel, remainingRows);
+        setModelRows(targetModel, targetModel.rows.concat(movedRows));
+        renderTable(sourceModel);
+        renderTable(targetModel);
         updateBadges();
     }
 }
@@ -195,7 +375,10 @@ function initializeDataPathModal() {
     const saveDataPathButton = document.getElementById('saveDataPathButton');
     const pathValidationMessage = document.getElementById('pathValidationMessage');
     let currentDataPathInput = null;
+    let currentDataPathRow = null;
     let validationTimeout = null;
+    let validationController = null;
+    let lastValidatedPath = null;
 
     // Function to update validation message
     function updateValidationMessage(exists, valid, message) {
@@ -221,15 +404,32 @@ function initializeDataPathModal() {
         }
     }
 
-    // Function to validate path with debouncing
-    function validatePath() {
-        const path = dataPathInput.value;
-        
+    // Function to cancel a pending or in-flight validation
+    function cancelValidation() {
         if (validationTimeout) {
             clearTimeout(validationTimeout);
+            validationTimeout = null;
+        }
+
+        if (validationController) {
+            validationController.abort();
+            validationController = null;
         }
+    }
+
+    // Function to validate path with debouncing
+    function validatePath() {
+        const path = dataPathInput.value.trim();
+
+        // Skip the request if the path has not changed since the last validation
+        if (path === lastValidatedPath) {
+            return;
+        }
+
+        cancelValidation();
+        lastValidatedPath = null;
         
-        if (!path || !path.trim()) {
+        if (!path) {
             updateValidationMessage(null, null, '');
             return;
         }
@@ -237,8 +437,17 @@ function initializeDataPathModal() {
         updateValidationMessage(null, null, 'Validating...');
         
         validationTimeout = setTimeout(() => {
-            validateDataPath(path)
+            validationTimeout = null;
+            const controller = new AbortController();
+            validationController = controller;
+
+            validateDataPath(path, controller.signal)
                 .then(result => {
+                    // Ignore results of superseded requests
+                    if (result === null || controller !== validationController) return;
+
+                    validationController = null;
+                    lastValidatedPath = path;
                     updateValidationMessage(result.exists, result.valid, result.message);
                 })
                 .catch(error => {
@@ -252,12 +461,12 @@ function initializeDataPathModal() {
         const input = event.target.closest('.editable-data-path');
         if (input) {
             currentDataPathInput = input;
+            currentDataPathRow = getModelRow(tableModels.selectedTableBody, input);
             dataPathInput.value = input.value || '';
             
-            // Clear any existing timeout
-            if (validationTimeout) {
-                clearTimeout(validationTimeout);
-            }
+            // Cancel any pending validation
+            cancelValidation();
+            lastValidatedPath = null;
             
             // Validate the current path
             validatePath();
@@ -272,15 +481,17 @@ function initializeDataPathModal() {
     saveDataPathButton.addEventListener('click', () => {
         if (currentDataPathInput) {
             currentDataPathInput.value = dataPathInput.value;
+            if (currentDataPathRow) {
+                currentDataPathRow.dataPath = dataPathInput.value;
+            }
             dataPathModal.hide();
         }
     });
 
     // Clear validation when modal is hidden
     dataPathModal._element.addEventListener('hidden.bs.modal', () => {
-        if (validationTimeout) {
-            clearTimeout(validationTimeout);
-        }
+        cancelValidation();
+        lastValidatedPath = null;
         updateValidationMessage(null, null, '');
     });
 }
@@ -292,11 +503,13 @@ function initializePvLoggerPathModal() {
     const pvLoggerPathInput = document.getElementById('pvLoggerPathInput');
     const savePvLoggerPathButton = document.getElementById('savePvLoggerPathButton');
     let currentPvLoggerPathInput = null;
+    let currentPvLoggerPathRow = null;
 
     document.getElementById('selectedTableBody').addEventListener('click', event => {
         const input = event.target.closest('.editable-pvlogger-path');
         if (input) {
             currentPvLoggerPathInput = input;
+            currentPvLoggerPathRow = getModelRow(tableModels.selectedTableBody, input);
             pvLoggerPathInput.value = input.value || '';
             pvLoggerPathModal.show();
         }
@@ -305,6 +518,9 @@ function initializePvLoggerPathModal() {
     savePvLoggerPathButton.addEventListener('click', () => {
         if (currentPvLoggerPathInput) {
             currentPvLoggerPathInput.value = pvLoggerPathInput.value;
+            if (currentPvLoggerPathRow) {
+                currentPvLoggerPathRow.pvlogPath = pvLoggerPathInput.value;
+            }
             pvLoggerPathModal.hide();
         }
     });
@@ -315,7 +531,7 @@ function initializeAcknowledgmentsModal() {
     const acknowledgementsModal = new bootstrap.Modal(document.getElementById('acknowledgementsModal'));
     const saveAcknowledgmentsButton = document.getElementById('saveAcknowledgmentsButton');
     let currentAcknowledgmentsInput = null;
-    let currentAcknowledgmentsData = null;
+    let currentAcknowledgmentsRow = null;
 
     document.querySelector('.acknowledgments-list').addEventListener('click', event => {
         const formCheck = event.target.closest('.form-check');
@@ -331,15 +547,14 @@ function initializeAcknowledgmentsModal() {
         const input = event.target.closest('.editable-acknowledgments');
         if (input) {
             currentAcknowledgmentsInput = input;
-            currentAcknowledgmentsData = input.nextElementSibling.nextElementSibling;
+            currentAcknowledgmentsRow = getModelRow(tableModels.selectedTableBody, input);
             
             document.querySelectorAll('.acknowledgments-list .form-check-input').forEach(checkbox => {
                 checkbox.checked = false;
             });
 
-            if (currentAcknowledgmentsData.value) {
-                const selectedAcks = JSON.parse(currentAcknowledgmentsData.value);
-                selectedAcks.forEach(ackId => {
+            if (currentAcknowledgmentsRow) {
+                currentAcknowledgmentsRow.acknowledgments.forEach(ackId => {
                     const checkbox = document.getElementById(`ack${ackId}`);
                     if (checkbox) {
                         checkbox.checked = true;
@@ -352,7 +567,7 @@ function initializeAcknowledgmentsModal() {
     });
 
     saveAcknowledgmentsButton.addEventListener('click', () => {
-        if (currentAcknowledgmentsInput && currentAcknowledgmentsData) {
+        if (currentAcknowledgmentsInput && currentAcknowledgmentsRow) {
             const selectedAcks = [];
             const selectedTitles = [];
             
@@ -361,7 +576,7 @@ function initializeAcknowledgmentsModal() {
                 selectedTitles.push(checkbox.nextElementSibling.textContent.trim());
             });
 
-            currentAcknowledgmentsData.value = JSON.stringify(selectedAcks);
+            currentAcknowledgmentsRow.acknowledgments = selectedAcks;
             currentAcknowledgmentsInput.value = selectedTitles.length > 0 
                 ? selectedTitles.length + ' acknowledgment(s) selected'
                 : '';
@@ -372,31 +587,20 @@ function initializeAcknowledgmentsModal() {
 
 // Handle Create/Update button click
 function handleCreateUpdate() {
-    const selectedTableBody = document.getElementById('selectedTableBody');
-    if (!selectedTableBody) return;
+    const model = tableModels.selectedTableBody;
+    if (!model) return;
+
+    const rows = model.rows.map(row => {
+        const getValue = value => String(value ?? '').trim() || null;
 
-    const rows = Array.from(selectedTableBody.querySelectorAll('tr')).map(row => {
-        const getValue = (selector) => row.querySelector(selector)?.value?.trim() || null;
-        const getChecked = (selector) => row.querySelector(selector)?.checked || false;
-        
         const data = {
-            experiment_number: getValue('td:nth-child(7) input'),
-            title: getValue('td:nth-child(2) input'),
-            data_path: getValue('td:nth-child(3) input'),
-            pvlog_path: getValue('td:nth-child(4) input'),
-            doi: getChecked('td:nth-child(6) input'),
-            proposal_number: getValue('td:nth-child(8) input'),
-            acknowledgments: (() => {
-                const ackData = row.querySelector('.acknowledgments-data');
-                if (ackData && ackData.value) {
-                    try {
-                        return JSON.parse(ackData.value);
-                    } catch (e) {
-                        return [];
-                    }
-                }
-                return [];
-            })()
+            experiment_number: getValue(row.experiment),
+            title: getValue(row.title),
+            data_path: getValue(row.dataPath),
+            pvlog_path: getValue(row.pvlogPath),
+            doi: row.doi,
+            proposal_number: getValue(row.proposal),
+            acknowledgments: row.acknowledgments
         };
 
         return Object.values(data).some(value => 
@@ -415,7 +619,8 @@ function handleCreateUpdate() {
     .then(response => response.json())
     .then(result => {
         if (result.failure === 0) {
-            selectedTableBody.innerHTML = '';
+            setModelRows(model, []);
+            renderTable(model);
             updateBadges();
             showNotification('Success', `Successfully added ${result.success} rows to the queue.`);
         } else {
@@ -450,16 +655,18 @@ function initializeTableHandlers() {
 
     if (buttons.addNew) {
         buttons.addNew.addEventListener('click', () => {
-            const selectedTableBody = document.getElementById('selectedTableBody');
-            if (selectedTableBody) {
-                // Ensure we have the current data path template before creating new row
-                ensureDataPathTemplate().then(() => {
-                    selectedTableBody.appendChild(createRow());
+            const model = tableModels.selectedTableBody;
+            if (model) {
+                const appendRow = () => {
+                    setModelRows(model, model.rows.concat([createRow()]));
+                    renderTable(model);
                     updateBadges();
-                }).catch(() => {
+                };
+
+                // Ensure we have the current data path template before creating new row
+                ensureDataPathTemplate().then(appendRow).catch(() => {
                     // Proceed without template if fetch fails
-                    selectedTableBody.appendChild(createRow());
-                    updateBadges();
+                    appendRow();
                 });
             }
         });
@@ -486,14 +693,28 @@ function initializeTableHandlers() {
         });
     }
 
-    const selectedTableBody = document.getElementById('selectedTableBody');
-    if (selectedTableBody) {
-        selectedTableBody.addEventListener('change', event => {
+    // Keep the row models in sync with edits in the rendered rows
+    Object.values(tableModels).forEach(model => {
+        const tableBody = document.getElementById(model.tableId);
+        if (!tableBody) return;
+
+        const syncRow = event => {
+            const row = getModelRow(model, event.target);
+            if (!row) return;
+
             if (event.target.classList.contains('select-experiment')) {
+                setRowChecked(model, row, event.target.checked);
                 updateBadges();
+            } else if (event.target.dataset.field) {
+                row[event.target.dataset.field] = event.target.type === 'checkbox'
+                    ? event.target.checked
+                    : event.target.value;
             }
-        });
-    }
+        };
+
+        tableBody.addEventListener('change', syncRow);
+        tableBody.addEventListener('input', syncRow);
+    });
 }
 
 // Initialize modals
@@ -525,27 +746,22 @@ function ensureDataPathTemplate() {
 
 // Function to update data paths for existing rows in selected table
 function updateDataPathForExistingRows() {
-    const selectedTableBody = document.getElementById('selectedTableBody');
-    if (!selectedTableBody || !dataPathTemplate) return;
+    const model = tableModels.selectedTableBody;
+    if (!model || !dataPathTemplate) return;
     
-    const rows = selectedTableBody.querySelectorAll('tr');
-    rows.forEach(row => {
-        const dataPathInput = row.querySelector('.editable-data-path');
-        const experimentInput = row.querySelector('td:nth-child(7) input');
+    model.rows.forEach(row => {
+        const runMatch = row.experiment.match(/\d+/);
+        const runId = runMatch ? runMatch[0] : '';
         
-        if (dataPathInput && experimentInput) {
-            const experimentId = experimentInput.value;
-            const runMatch = experimentId.match(/\d+/);
-            const runId = runMatch ? runMatch[0] : '';
-            
-            // Only update if the current value looks like it was generated from a template
-            // (to avoid overwriting user-modified paths)
-            const currentValue = dataPathInput.value;
-            if (!currentValue || currentValue.includes('{') || currentValue.includes('/data/') || currentValue.includes('Run')) {
-                dataPathInput.value = formatDataPath(dataPathTemplate, { runId: runId });
-            }
+        // Only update if the current value looks like it was generated from a template
+        // (to avoid overwriting user-modified paths)
+        const currentValue = row.dataPath;
+        if (!currentValue || currentValue.includes('{') || currentValue.includes('/data/') || currentValue.includes('Run')) {
+            row.dataPath = formatDataPath(dataPathTemplate, { runId: runId });
         }
     });
+
+    renderTable(model);
 }
 
 // Auto-submit filter form on dropdown change and fetch data path template
@@ -608,23 +824,7 @@ function createRow() {
     // Use the current data path template for new rows with run context
     const formattedDataPath = formatDataPath(dataPathTemplate, { runId: runNumber });
     
-    const row = document.createElement('tr');
-    row.innerHTML = `
-        <td><input type="checkbox" class="select-experiment" checked></td>
-        <td><input type="text" class="form-control" placeholder="Title"></td>
-        <td><input type="text" class="form-control editable-data-path" value="${formattedDataPath}" style="width: 100%;"></td>
-        <td><input type="text" class="form-control editable-pvlogger-path" value="" style="width: 100%;"></td>
-        <td>
-            <input type="text" class="form-control editable-acknowledgments" readonly placeholder="Click to add acknowledgments">
-            <div class="acknowledgments-tooltip"></div>
-            <input type="hidden" class="acknowledgments-data">
-        </td>
-        <td><input type="checkbox" class="doi-checkbox" checked></td>
-        <td><input type="text" class="form-control" placeholder="Experiment"></td>
-        <td><input type="text" class="form-control" placeholder="Proposal"></td>
-        <td>New</td>
-    `;
-    return row;
+    return createSelectedRow(null, formattedDataPath);
 }
 
 function showNotification(type, message) {
@@ -664,8 +864,40 @@ function fetchDataPathTemplate(stationId, techniqueId) {
         });
 }
 
-// Function to validate if a data path exists
-function validateDataPath(path) {
+// Function to expand and validate the data paths of many experiments in a single request
+function expandDataPaths(experimentIds) {
+    const stationSelect = document.getElementById('stationSelect');
+    const techniqueSelect = document.getElementById('techniqueSelect');
+
+    if (!stationSelect || !techniqueSelect || !stationSelect.value || !techniqueSelect.value) {
+        return Promise.reject('Station or technique not selected');
+    }
+
+    return fetch('/api/v1/expand_data_paths', {
+        method: 'POST',
+        headers: {
+            'Content-Type': 'application/json',
+        },
+        body: JSON.stringify({
+            station_id: stationSelect.value,
+            technique_id: techniqueSelect.value,
+            experiment_ids: experimentIds
+        })
+    })
+    .then(response => {
+        if (!response.ok) {
+            throw new Error(`Server responded with ${response.status}`);
+        }
+        return response.json();
+    })
+    .then(result => {
+        dataPathTemplate = result.template;
+        return new Map(result.paths.map(path => [path.experiment_id, path]));
+    });
+}
+
+// Function to validate if a data path exists, resolving to null if the request is aborted
+function validateDataPath(path, signal = undefined) {
     if (!path || !path.trim()) {
         return Promise.resolve({ exists: false, valid: false, message: 'Please enter a path' });
     }
@@ -675,7 +907,8 @@ function validateDataPath(path) {
         headers: {
             'Content-Type': 'application/json',
         },
-        body: JSON.stringify({ path: path.trim() })
+        body: JSON.stringify({ path: path.trim() }),
+        signal
     })
     .then(response => {
         if (!response.ok) {
@@ -700,6 +933,10 @@ function validateDataPath(path) {
         };
     })
     .catch(error => {
+        if (error.name === 'AbortError') {
+            return null;
+        }
+
         console.error('Error validating path:', error);
         return {
             exists: null,
@@ -711,6 +948,7 @@ function validateDataPath(path) {
 
 // Initialize the application
 document.addEventListener('DOMContentLoaded', () => {
+    initializeTableModels();
     fetchAcknowledgmentOptions();
     initializeTableHandlers();
     initializeModals();
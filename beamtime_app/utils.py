@@ -12,9 +12,29 @@
 # Copyright (C) 2025 NSF SEES, USA
 # ----------------------------------------------------------------------------------
 
+import csv
+import io
+import json
 import re
+import threading
+import time
+from concurrent.futures import Future
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Any, Callable, Hashable, Iterable, Iterator, Optional
+
+# Size in characters of the chunks yielded by the export serializers
+EXPORT_CHUNK_SIZE = 64 * 1024
+
+# Size in characters of the chunks yielded by streamed templates, kept small so the
+# page layout is flushed before the slow parts of the template are rendered
+TEMPLATE_CHUNK_SIZE = 2 * 1024
+
+# Rendered by a streamed template to send everything buffered so far, removed from the output
+STREAM_FLUSH = "\x00flush\x00"
+
+# Placeholders supported in the data path templates
+TEMPLATE_PLACEHOLDER = re.compile(r"\{(YEAR|RUN)\}")
 
 
 def to_dictionary(obj: any) -> dict[str, any]:
@@ -22,20 +42,101 @@ def to_dictionary(obj: any) -> dict[str, any]:
     return {column: getattr(obj, column) for column in obj.__table__.columns.keys()}
 
 
-def format_experiment_data(experiments: list[dict[str, any]]) -> list[dict[str, any]]:
-    """Formats experiment data."""
-    return [
-        {
-            "id": exp.get("id", None),
-            "title": exp.get("title", "N/A"),
-            "run_id": exp.get("run_id", None),
-            "beamline_id": exp.get("beamline_id", None),
-            "proposal": exp.get("proposal_id", "N/A"),
-            "process_status": exp.get("process_status", "N/A"),
-            "user_folder": exp.get("user_folder", "N/A"),
-        }
-        for exp in experiments
-    ]
+@lru_cache(maxsize=256)
+def compile_path_template(data_path_id: int, template: str) -> tuple[str, ...]:
+    """
+    Splits a data path template into literal text and placeholder names.
+
+    The result alternates between literal text (even indexes) and placeholder names
+    (odd indexes). It is cached per data path row and template, so an edited template
+    is compiled again.
+    """
+    return tuple(TEMPLATE_PLACEHOLDER.split(template))
+
+
+def expand_path_template(compiled: tuple[str, ...], values: dict[str, str]) -> str:
+    """Expands a compiled data path template with the given placeholder values."""
+    return "".join(part if index % 2 == 0 else values.get(part, "") for index, part in enumerate(compiled))
+
+
+def run_number(run_name: str) -> str:
+    """Extracts the run number from a run name (e.g., "2025-1" -> "1")."""
+    return run_name.split("-")[-1] if "-" in run_name else run_name
+
+
+def stream_csv(columns: list[str], rows: Iterable[dict[str, Any]]) -> Iterator[str]:
+    """Serializes rows to CSV chunks, yielding the header row immediately. Lists are comma-joined."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+
+    writer.writerow(columns)
+    yield buffer.getvalue()
+    buffer.seek(0)
+    buffer.truncate()
+
+    for row in rows:
+        writer.writerow(
+            [",".join(map(str, value)) if isinstance(value, list) else value for value in map(row.get, columns)]
+        )
+        if buffer.tell() >= EXPORT_CHUNK_SIZE:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+
+    if buffer.tell():
+        yield buffer.getvalue()
+
+
+def buffer_chunks(chunks: Iterable[str], size: int = TEMPLATE_CHUNK_SIZE) -> Iterator[str]:
+    """
+    Joins the many small chunks of a template stream into chunks of at least size characters.
+
+    A STREAM_FLUSH chunk sends the buffered chunks right away, templates render it before
+    the sections that wait on queries.
+    """
+    buffer = []
+    buffered = 0
+
+    for chunk in chunks:
+        if chunk == STREAM_FLUSH:
+            if buffer:
+                yield "".join(buffer)
+                buffer = []
+                buffered = 0
+            continue
+
+        buffer.append(chunk)
+        buffered += len(chunk)
+        if buffered >= size:
+            yield "".join(buffer)
+            buffer = []
+            buffered = 0
+
+    if buffer:
+        yield "".join(buffer)
+
+
+def stream_ndjson(rows: Iterable[dict[str, Any]]) -> Iterator[str]:
+    """Serializes rows to newline delimited JSON chunks, yielding the first row immediately."""
+    rows = iter(rows)
+    for row in rows:
+        yield json.dumps(row, default=str) + "\n"
+        break
+
+    chunk = []
+    size = 0
+
+    for row in rows:
+        line = json.dumps(row, default=str) + "\n"
+        chunk.append(line)
+        size += len(line)
+        if size >= EXPORT_CHUNK_SIZE:
+            yield "".join(chunk)
+            chunk = []
+            size = 0
+
+    if chunk:
+        yield "".join(chunk)
 
 
 def format_info_modification_time(info: list[dict[str, any]]) -> Optional[str]:
@@ -132,3 +233,62 @@ def validate_and_normalize_datapath(datapath: str) -> dict[str, any]:
         "normalized": normalized,
         "message": "Path exists" if exists else "Path is valid",
     }
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls that share a key into a single call.
+
+    Callers arriving while a call for the same key is in flight wait for and share its
+    result. Results are also kept for ttl seconds, so bursts of identical requests
+    that arrive just after each other are answered without repeating the work.
+    """
+
+    _MAX_RESULTS = 1024
+
+    def __init__(self, ttl: float = 0.0) -> None:
+        self._ttl = ttl
+        self._lock = threading.Lock()
+        self._calls: dict[Hashable, Future] = {}
+        self._results: dict[Hashable, tuple[float, Any]] = {}
+
+    def do(self, key: Hashable, function: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Runs function once for all concurrent callers with the same key."""
+        with self._lock:
+            cached = self._results.get(key)
+            if cached is not None and time.monotonic() - cached[0] < self._ttl:
+                return cached[1]
+
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = self._calls[key] = Future()
+
+        if not leader:
+            return future.result()
+
+        try:
+            result = function(*args, **kwargs)
+        except BaseException as e:
+            # Also release the waiters when the leader is interrupted, e.g. by a worker timeout
+            with self._lock:
+                self._calls.pop(key, None)
+            future.set_exception(e if isinstance(e, Exception) else RuntimeError(f"Call for {key!r} was interrupted"))
+            raise
+
+        with self._lock:
+            self._calls.pop(key, None)
+            if self._ttl > 0:
+                self._store(key, result)
+        future.set_result(result)
+
+        return result
+
+    def _store(self, key: Hashable, result: Any) -> None:
+        """Stores a result, dropping expired results once the store grows large."""
+        now = time.monotonic()
+        if len(self._results) >= self._MAX_RESULTS:
+            self._results = {k: v for k, v in self._results.items() if now - v[0] < self._ttl}
+            if len(self._results) >= self._MAX_RESULTS:
+                self._results.clear()
+        self._results[key] = (now, result)
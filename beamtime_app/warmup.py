@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+# ----------------------------------------------------------------------------------
+# Project: BeamtimeApp
+# File: beamtime_app/warmup.py
+# ----------------------------------------------------------------------------------
+# Purpose:
+# This file is used to warm up a worker before it takes traffic, by opening database
+# connections, configuring the mappers, compiling the templates and statements and
+# loading the in-memory caches.
+# ----------------------------------------------------------------------------------
+# Author: Christofanis Skordas
+#
+# Copyright (C) 2025 GSECARS, The University of Chicago, USA
+# Copyright (C) 2025 NSF SEES, USA
+# ----------------------------------------------------------------------------------
+
+import os
+import threading
+import time
+from typing import Any, Callable
+
+from flask import Flask
+from sqlalchemy import text
+from sqlalchemy.orm import configure_mappers
+
+from beamtime_app import database_config
+from beamtime_app.crud import get_all_entries, get_data_path_entry, get_experiment_runs, trigram_search_available
+from beamtime_app.database import ENGINE
+from beamtime_app.models import Acknowledgment, Beamline, Info, Run, Station, Technique
+from beamtime_app.read_model import EXPERIMENTS
+from beamtime_app.search import SEARCH_INDEX
+
+__all__ = ["WARMUP", "WarmUp"]
+
+
+# Templates rendered by the app
+TEMPLATES = ("layout.html", "index.html")
+
+# Seconds to wait before retrying a failed warm-up phase, e.g. while the database is down
+RETRY_DELAY = 5.0
+
+
+class WarmUp:
+    """
+    Runs the worker warm-up phases on a background thread and tracks their progress.
+
+    The phases run in order and their durations are recorded. A failed phase is retried
+    after a delay, so a worker that boots while the database is unavailable becomes
+    ready once it is back. The worker is ready only when every phase has completed.
+
+    The warm-up is started by the first request of each process, so it also runs in
+    workers forked from a preloaded app, which do not inherit the parent's threads.
+    """
+
+    def __init__(self, connections: int = 4, retry_delay: float = RETRY_DELAY) -> None:
+        self._connections = connections
+        self._retry_delay = retry_delay
+        self._timings: dict[str, float] = {}
+        self._error: str | None = None
+        self._started_at: float | None = None
+        self._finished_at: float | None = None
+        self._pid: int | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def ready(self) -> bool:
+        """Returns True once every warm-up phase has completed."""
+        return self._finished_at is not None
+
+    def start(self, app: Flask) -> None:
+        """Starts the warm-up on a background thread, once per process."""
+        if self._pid == os.getpid():
+            return
+
+        with self._lock:
+            if self._pid == os.getpid():
+                return
+
+            # A forked process starts over, the warm-up thread of its parent does not exist in it
+            self._pid = os.getpid()
+            self._timings = {}
+            self._error = None
+            self._finished_at = None
+            self._started_at = time.monotonic()
+
+        threading.Thread(target=self.run, args=(app,), name="warm-up", daemon=True).start()
+
+    def run(self, app: Flask) -> None:
+        """Runs the warm-up phases in order, retrying a failed phase until it succeeds."""
+        phases: list[tuple[str, Callable[[], None]]] = [
+            ("mappers", configure_mappers),
+            ("connections", self._open_connections),
+            ("templates", lambda: self._compile_templates(app)),
+            ("statements", self._compile_statements),
+            ("caches", self._load_caches),
+        ]
+
+        for name, phase in phases:
+            while True:
+                started = time.monotonic()
+                try:
+                    phase()
+                except Exception as e:
+                    self._error = f"{name}: {e}"
+                    print(f"Warm-up phase {name} failed, retrying in {self._retry_delay}s: {e}")
+                    time.sleep(self._retry_delay)
+                    continue
+
+                self._timings[name] = time.monotonic() - started
+                self._error = None
+                break
+
+        self._finished_at = time.monotonic()
+
+    def status(self) -> dict[str, Any]:
+        """Returns the readiness, the duration of each completed phase in ms and the last error."""
+        started_at = self._started_at
+        finished_at = self._finished_at
+        total = (finished_at or time.monotonic()) - started_at if started_at is not None else 0.0
+
+        return {
+            "ready": self.ready,
+            "phases": {name: round(duration * 1000, 1) for name, duration in self._timings.items()},
+            "total": round(total * 1000, 1),
+            "error": self._error,
+        }
+
+    def _open_connections(self) -> None:
+        """Opens the pool connections at once, so they are kept in the pool afterwards."""
+        connections = []
+        try:
+            for _ in range(min(self._connections, ENGINE.pool.size())):
+                connection = ENGINE.connect()
+                connections.append(connection)
+                connection.execute(text("SELECT 1"))
+        finally:
+            for connection in connections:
+                connection.close()
+
+    @staticmethod
+    def _compile_templates(app: Flask) -> None:
+        """Compiles the templates into the Jinja cache."""
+        for template in TEMPLATES:
+            app.jinja_env.get_template(template)
+
+    @staticmethod
+    def _compile_statements() -> None:
+        """Runs the hot statements once, so their compiled form is cached by the engine."""
+        for model in (Beamline, Station, Technique, Run, Acknowledgment, Info):
+            get_all_entries(model)
+        get_data_path_entry(0, 0)
+        get_experiment_runs([0])
+
+    @staticmethod
+    def _load_caches() -> None:
+        """Loads the experiment read model, builds the search index and checks for pg_trgm."""
+        EXPERIMENTS.sync()
+        SEARCH_INDEX.prime()
+        trigram_search_available()
+
+
+# Process wide warm-up, started by the first request of each process
+WARMUP = WarmUp(connections=database_config.warmup_connections)
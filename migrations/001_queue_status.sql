@@ -0,0 +1,17 @@
+-- ----------------------------------------------------------------------------------
+-- Project: BeamtimeApp
+-- File: migrations/001_queue_status.sql
+-- ----------------------------------------------------------------------------------
+-- Purpose:
+-- This file adds the processing status columns used by the queue processor.
+-- ----------------------------------------------------------------------------------
+-- Author: Christofanis Skordas
+--
+-- Copyright (C) 2025 GSECARS, The University of Chicago, USA
+-- Copyright (C) 2025 NSF SEES, USA
+-- ----------------------------------------------------------------------------------
+
+ALTER TABLE queue ADD COLUMN IF NOT EXISTS status TEXT;
+ALTER TABLE queue ADD COLUMN IF NOT EXISTS status_message TEXT;
+
+CREATE INDEX IF NOT EXISTS ix_queue_status ON queue (status);
@@ -0,0 +1,37 @@
+-- ----------------------------------------------------------------------------------
+-- Project: BeamtimeApp
+-- File: migrations/002_queue_acknowledgment.sql
+-- ----------------------------------------------------------------------------------
+-- Purpose:
+-- This file moves the queue acknowledgments from comma-separated strings into the
+-- indexed queue_acknowledgment association table.
+-- ----------------------------------------------------------------------------------
+-- Author: Christofanis Skordas
+--
+-- Copyright (C) 2025 GSECARS, The University of Chicago, USA
+-- Copyright (C) 2025 NSF SEES, USA
+-- ----------------------------------------------------------------------------------
+
+BEGIN;
+
+CREATE TABLE IF NOT EXISTS queue_acknowledgment (
+    queue_id INTEGER NOT NULL REFERENCES queue (id) ON DELETE CASCADE,
+    acknowledgment_id INTEGER NOT NULL REFERENCES acknowledgment (id),
+    PRIMARY KEY (queue_id, acknowledgment_id)
+);
+
+CREATE INDEX IF NOT EXISTS ix_queue_acknowledgment_acknowledgment_id ON queue_acknowledgment (acknowledgment_id);
+
+-- Copy the existing comma-separated ids, skipping anything that is not a known acknowledgment
+INSERT INTO queue_acknowledgment (queue_id, acknowledgment_id)
+SELECT DISTINCT queue.id, acknowledgment.id
+FROM queue
+CROSS JOIN LATERAL unnest(string_to_array(queue.acknowledgments, ',')) AS item(value)
+JOIN acknowledgment ON acknowledgment.id = CASE WHEN trim(item.value) ~ '^[0-9]{1,9}$' THEN trim(item.value)::integer END
+ON CONFLICT DO NOTHING;
+
+-- The legacy queue.acknowledgments column is still written by the app alongside this
+-- table, so its readers keep working. It can be dropped once no other readers remain:
+-- ALTER TABLE queue DROP COLUMN acknowledgments;
+
+COMMIT;
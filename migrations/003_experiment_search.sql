@@ -0,0 +1,21 @@
+-- ----------------------------------------------------------------------------------
+-- Project: BeamtimeApp
+-- File: migrations/003_experiment_search.sql
+-- ----------------------------------------------------------------------------------
+-- Purpose:
+-- This file adds the trigram indexes used by the experiment search endpoint.
+-- ----------------------------------------------------------------------------------
+-- Author: Christofanis Skordas
+--
+-- Copyright (C) 2025 GSECARS, The University of Chicago, USA
+-- Copyright (C) 2025 NSF SEES, USA
+-- ----------------------------------------------------------------------------------
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+-- Serve substring (ILIKE) and similarity (%) matches on the title and user folder
+CREATE INDEX IF NOT EXISTS ix_experiment_title_trgm ON experiment USING gin (title gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS ix_experiment_user_folder_trgm ON experiment USING gin (user_folder gin_trgm_ops);
+
+-- Serve proposal number prefix (LIKE 'x%') matches
+CREATE INDEX IF NOT EXISTS ix_experiment_proposal_id_text ON experiment ((CAST(proposal_id AS TEXT)) text_pattern_ops);
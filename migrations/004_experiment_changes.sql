@@ -0,0 +1,56 @@
+-- ----------------------------------------------------------------------------------
+-- Project: BeamtimeApp
+-- File: migrations/004_experiment_changes.sql
+-- ----------------------------------------------------------------------------------
+-- Purpose:
+-- This file adds the experiment change markers used by the experiment read model to
+-- fetch only the rows changed since its last sync.
+-- ----------------------------------------------------------------------------------
+-- Author: Christofanis Skordas
+--
+-- Copyright (C) 2025 GSECARS, The University of Chicago, USA
+-- Copyright (C) 2025 NSF SEES, USA
+-- ----------------------------------------------------------------------------------
+
+BEGIN;
+
+-- Modification time of each experiment, maintained by the trigger below for every writer
+ALTER TABLE experiment ADD COLUMN IF NOT EXISTS updated_at TIMESTAMPTZ NOT NULL DEFAULT now();
+
+CREATE INDEX IF NOT EXISTS ix_experiment_updated_at ON experiment (updated_at);
+
+CREATE OR REPLACE FUNCTION experiment_set_updated_at() RETURNS trigger AS $$
+BEGIN
+    NEW.updated_at := clock_timestamp();
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS experiment_set_updated_at ON experiment;
+CREATE TRIGGER experiment_set_updated_at
+    BEFORE INSERT OR UPDATE ON experiment
+    FOR EACH ROW EXECUTE FUNCTION experiment_set_updated_at();
+
+-- Deleted experiment ids, so the read model can drop them without rescanning the table
+CREATE TABLE IF NOT EXISTS experiment_deletion (
+    experiment_id INTEGER PRIMARY KEY,
+    deleted_at TIMESTAMPTZ NOT NULL DEFAULT now()
+);
+
+CREATE INDEX IF NOT EXISTS ix_experiment_deletion_deleted_at ON experiment_deletion (deleted_at);
+
+CREATE OR REPLACE FUNCTION experiment_record_deletion() RETURNS trigger AS $$
+BEGIN
+    INSERT INTO experiment_deletion (experiment_id, deleted_at)
+    VALUES (OLD.id, clock_timestamp())
+    ON CONFLICT (experiment_id) DO UPDATE SET deleted_at = EXCLUDED.deleted_at;
+    RETURN OLD;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS experiment_record_deletion ON experiment;
+CREATE TRIGGER experiment_record_deletion
+    AFTER DELETE ON experiment
+    FOR EACH ROW EXECUTE FUNCTION experiment_record_deletion();
+
+COMMIT;
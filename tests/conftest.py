@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+# ----------------------------------------------------------------------------------
+# Project: BeamtimeApp
+# File: tests/conftest.py
+# ----------------------------------------------------------------------------------
+# Purpose:
+# This file is used to point the app at a temporary SQLite database for the tests.
+# ----------------------------------------------------------------------------------
+# Author: Christofanis Skordas
+#
+# Copyright (C) 2025 GSECARS, The University of Chicago, USA
+# Copyright (C) 2025 NSF SEES, USA
+# ----------------------------------------------------------------------------------
+
+import os
+import tempfile
+from pathlib import Path
+
+import pytest
+from sqlalchemy import Column, Integer, Table, text
+
+# The database engine is created on import, so the URI is set before the app is imported
+os.environ["DATABASE_URI"] = f"sqlite:///{Path(tempfile.mkdtemp()) / 'beamtime.db'}"
+
+from beamtime_app.database import BASE, ENGINE  # noqa: E402
+from beamtime_app.models import Experiment, ExperimentDeletion, ProcessStatus, Queue  # noqa: E402
+
+# Tables referenced by the model foreign keys that have no model
+for name in ("esaf_type", "esaf_status", "institution", "proposal", "user_level"):
+    if name not in BASE.metadata.tables:
+        Table(name, BASE.metadata, Column("id", Integer, primary_key=True))
+
+# SQLite versions of the triggers added by migrations/004_experiment_changes.sql
+EXPERIMENT_TRIGGERS = (
+    """
+    CREATE TRIGGER experiment_set_updated_at AFTER UPDATE ON experiment
+    BEGIN
+        UPDATE experiment SET updated_at = CURRENT_TIMESTAMP WHERE id = NEW.id;
+    END
+    """,
+    """
+    CREATE TRIGGER experiment_record_deletion AFTER DELETE ON experiment
+    BEGIN
+        INSERT OR REPLACE INTO experiment_deletion (experiment_id, deleted_at) VALUES (OLD.id, CURRENT_TIMESTAMP);
+    END
+    """,
+)
+
+
+@pytest.fixture
+def queue_table():
+    """Creates an empty queue table for a test."""
+    Queue.__table__.create(ENGINE)
+    yield
+    Queue.__table__.drop(ENGINE)
+
+
+@pytest.fixture
+def experiment_tables():
+    """Creates empty experiment tables with the change tracking triggers for a test."""
+    tables = [ProcessStatus.__table__, Experiment.__table__, ExperimentDeletion.__table__]
+    BASE.metadata.create_all(ENGINE, tables=tables)
+    with ENGINE.begin() as connection:
+        for trigger in EXPERIMENT_TRIGGERS:
+            connection.execute(text(trigger))
+    yield
+    BASE.metadata.drop_all(ENGINE, tables=tables)
+
+
+@pytest.fixture
+def all_tables():
+    """Creates all the empty tables for a test."""
+    BASE.metadata.create_all(ENGINE)
+    yield
+    BASE.metadata.drop_all(ENGINE)
@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+# ----------------------------------------------------------------------------------
+# Project: BeamtimeApp
+# File: tests/test_export.py
+# ----------------------------------------------------------------------------------
+# Purpose:
+# This file is used to test the streamed experiment and queue exports.
+# ----------------------------------------------------------------------------------
+# Author: Christofanis Skordas
+#
+# Copyright (C) 2025 GSECARS, The University of Chicago, USA
+# Copyright (C) 2025 NSF SEES, USA
+# ----------------------------------------------------------------------------------
+
+from beamtime_app import create_flask_app
+from beamtime_app.config import Config
+
+
+class ExportConfig(Config):
+    """Configuration without the worker warm-up."""
+
+    WARMUP = False
+
+
+def test_export_streams_the_rows(all_tables):
+    client = create_flask_app(ExportConfig).test_client()
+
+    response = client.get("/api/v1/export/queue")
+    assert response.status_code == 200
+    assert response.get_data(as_text=True).splitlines()[0].startswith("id,experiment_number,")
+
+
+def test_export_reports_a_failing_query_as_an_error():
+    # Without the queue table the query fails before the first row is read
+    client = create_flask_app(ExportConfig).test_client()
+
+    response = client.get("/api/v1/export/queue?format=ndjson")
+    assert response.status_code == 500
+    assert "error" in response.get_json()
+
+
+def test_export_rejects_an_unknown_format():
+    client = create_flask_app(ExportConfig).test_client()
+
+    response = client.get("/api/v1/export/queue?format=xml")
+    assert response.status_code == 400
@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+# ----------------------------------------------------------------------------------
+# Project: BeamtimeApp
+# File: tests/test_queue.py
+# ----------------------------------------------------------------------------------
+# Purpose:
+# This file is used to test adding rows and their acknowledgments to the queue.
+# ----------------------------------------------------------------------------------
+# Author: Christofanis Skordas
+#
+# Copyright (C) 2025 GSECARS, The University of Chicago, USA
+# Copyright (C) 2025 NSF SEES, USA
+# ----------------------------------------------------------------------------------
+
+from sqlalchemy import insert, select
+
+from beamtime_app.crud import add_to_queue, get_queue_by_acknowledgment
+from beamtime_app.database import session_scope
+from beamtime_app.models import Acknowledgment, Queue
+
+
+def queue_row(title: str, acknowledgments: list[int]) -> dict:
+    """Returns a queue row as sent by the browser."""
+    return {
+        "experiment_number": 1,
+        "title": title,
+        "data_path": "/data",
+        "pvlog_path": "/pvlog",
+        "doi": False,
+        "proposal_number": 1,
+        "acknowledgments": acknowledgments,
+    }
+
+
+def test_rows_citing_unknown_acknowledgments_fail_alone(all_tables):
+    with session_scope() as session:
+        session.execute(insert(Acknowledgment), [{"id": 1, "title": "NSF", "text": "Funded by NSF"}])
+
+    result = add_to_queue([queue_row("cited", [1]), queue_row("unknown", [1, 2]), queue_row("none", [])])
+
+    assert result == {"success": 2, "failure": 1}
+    with session_scope() as session:
+        legacy = dict(session.execute(select(Queue.title, Queue.acknowledgments)).all())
+    assert legacy == {"cited": "1", "none": ""}
+
+    rows = get_queue_by_acknowledgment(1)
+    assert [(row["title"], row["acknowledgments"]) for row in rows] == [("cited", [1])]
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+# ----------------------------------------------------------------------------------
+# Project: BeamtimeApp
+# File: tests/test_queue_processor.py
+# ----------------------------------------------------------------------------------
+# Purpose:
+# This file is used to test the queue processor against a temporary directory.
+# ----------------------------------------------------------------------------------
+# Author: Christofanis Skordas
+#
+# Copyright (C) 2025 GSECARS, The University of Chicago, USA
+# Copyright (C) 2025 NSF SEES, USA
+# ----------------------------------------------------------------------------------
+
+from sqlalchemy import insert, select
+
+from beamtime_app.database import session_scope
+from beamtime_app.models import Queue, QueueStatus
+from beamtime_app.queue_processor import QueueProcessor
+
+
+def add_rows(*data_paths: str) -> None:
+    """Adds a pending queue row for each data path."""
+    with session_scope() as session:
+        session.execute(
+            insert(Queue),
+            [
+                {
+                    "experiment_number": 1,
+                    "title": "Test",
+                    "data_path": data_path,
+                    "pvlog_path": "",
+                    "doi": False,
+                    "proposal_number": 1,
+                    "acknowledgments": "",
+                }
+                for data_path in data_paths
+            ],
+        )
+
+
+def get_statuses() -> dict[str, tuple[str, str]]:
+    """Returns the status and status message of the queue rows by data path."""
+    with session_scope() as session:
+        return {row.data_path: (row.status, row.status_message) for row in session.scalars(select(Queue))}
+
+
+def test_run_creates_folders_and_writes_statuses(queue_table, tmp_path):
+    (tmp_path / "blocked").write_text("")
+    add_rows("/data/2025/run1/user", "/../../escape", "/blocked/user")
+
+    result = QueueProcessor(root=tmp_path, workers=2, retry_delay=0).run()
+
+    statuses = get_statuses()
+    assert result == {"success": 1, "failure": 2}
+    assert (tmp_path / "data/2025/run1/user").is_dir()
+    assert statuses["/data/2025/run1/user"][0] == QueueStatus.DONE
+    assert statuses["/../../escape"] == (QueueStatus.FAILED, "Path escapes the root directory: /../../escape")
+    assert statuses["/blocked/user"][0] == QueueStatus.FAILED
+    assert not (tmp_path.parent / "escape").exists()
+
+
+def test_failed_rows_are_only_processed_again_with_retry_failed(queue_table, tmp_path):
+    (tmp_path / "blocked").write_text("")
+    add_rows("/blocked/user")
+    processor = QueueProcessor(root=tmp_path, retry_delay=0)
+
+    assert processor.run() == {"success": 0, "failure": 1}
+    assert processor.run() == {"success": 0, "failure": 0}
+
+    (tmp_path / "blocked").unlink()
+    assert processor.run(retry_failed=True) == {"success": 1, "failure": 0}
+    assert get_statuses()["/blocked/user"][0] == QueueStatus.DONE
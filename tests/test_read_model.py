@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+# ----------------------------------------------------------------------------------
+# Project: BeamtimeApp
+# File: tests/test_read_model.py
+# ----------------------------------------------------------------------------------
+# Purpose:
+# This file is used to test the incremental sync of the experiment read model.
+# ----------------------------------------------------------------------------------
+# Author: Christofanis Skordas
+#
+# Copyright (C) 2025 GSECARS, The University of Chicago, USA
+# Copyright (C) 2025 NSF SEES, USA
+# ----------------------------------------------------------------------------------
+
+import datetime
+
+import pytest
+from sqlalchemy import delete, insert, update
+
+from beamtime_app.database import session_scope
+from beamtime_app.models import Experiment, ProcessStatus
+from beamtime_app.read_model import ExperimentReadModel
+
+
+# Values of the experiment columns the read model does not project
+EXPERIMENT_DEFAULTS = {
+    "time_request": 0,
+    "esaf_type_id": 1,
+    "esaf_status_id": 1,
+    "spokesperson_id": 1,
+    "beamline_contact_id": 1,
+    "description": "",
+    "start_date": datetime.datetime(2025, 1, 1),
+    "end_date": datetime.datetime(2025, 1, 2),
+    "data_doi": "",
+    "esaf_pdf_file": "",
+    "proposal_pdf_file": "",
+    "folder_status_id": 1,
+}
+
+
+def add_experiments(*experiment_ids: int, run_id: int = 1) -> None:
+    """Adds an experiment for each id."""
+    with session_scope() as session:
+        session.execute(
+            insert(Experiment),
+            [
+                EXPERIMENT_DEFAULTS
+                | {
+                    "id": experiment_id,
+                    "title": f"Experiment {experiment_id}",
+                    "run_id": run_id,
+                    "beamline_id": 1,
+                    "proposal_id": 100 + experiment_id,
+                    "process_status_id": 1,
+                    "user_folder": f"user{experiment_id}",
+                }
+                for experiment_id in experiment_ids
+            ],
+        )
+
+
+@pytest.fixture
+def read_model(experiment_tables):
+    """Returns a read model loaded with experiments 1 to 3, syncing on every access."""
+    with session_scope() as session:
+        session.execute(insert(ProcessStatus), [{"id": 1, "name": "New"}])
+    add_experiments(1, 2, 3)
+
+    model = ExperimentReadModel(sync_interval=0, reload_interval=3600)
+    model.sync()
+    return model
+
+
+def loaded_at(model: ExperimentReadModel) -> float:
+    """Returns the time of the last full reload."""
+    return model._snapshot.loaded_at
+
+
+def test_appended_experiments_are_added_incrementally(read_model):
+    reloaded = loaded_at(read_model)
+    add_experiments(4, 5, run_id=2)
+
+    assert [record.id for record in read_model.query()] == [1, 2, 3, 4, 5]
+    assert [record.id for record in read_model.query(run=2)] == [4, 5]
+    assert loaded_at(read_model) == reloaded
+
+
+def test_in_place_edits_are_picked_up(read_model):
+    reloaded = loaded_at(read_model)
+    with session_scope() as session:
+        # Same length as before, a checksum over the lengths would miss it
+        session.execute(update(Experiment).where(Experiment.id == 2).values(title="Experiment X", run_id=2))
+
+    record = next(record for record in read_model.query() if record.id == 2)
+    assert record.title == "Experiment X"
+    assert [record.id for record in read_model.query(run=1)] == [1, 3]
+    assert [record.id for record in read_model.query(run=2)] == [2]
+    assert loaded_at(read_model) == reloaded
+
+
+def test_deleted_experiments_are_removed(read_model):
+    reloaded = loaded_at(read_model)
+    with session_scope() as session:
+        session.execute(delete(Experiment).where(Experiment.id == 2))
+
+    assert [record.id for record in read_model.query()] == [1, 3]
+    assert [record.id for record in read_model.query(run=1)] == [1, 3]
+    assert loaded_at(read_model) == reloaded
+
+
+def test_experiments_below_the_loaded_ids_are_added(read_model):
+    add_experiments(0)
+
+    assert [record.id for record in read_model.query()] == [0, 1, 2, 3]
+    assert [record.id for record in read_model.query(run=1, beamline=1)] == [0, 1, 2, 3]
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+# ----------------------------------------------------------------------------------
+# Project: BeamtimeApp
+# File: tests/test_search.py
+# ----------------------------------------------------------------------------------
+# Purpose:
+# This file is used to test the in-process experiment search index.
+# ----------------------------------------------------------------------------------
+# Author: Christofanis Skordas
+#
+# Copyright (C) 2025 GSECARS, The University of Chicago, USA
+# Copyright (C) 2025 NSF SEES, USA
+# ----------------------------------------------------------------------------------
+
+from beamtime_app.read_model import ExperimentRecord
+from beamtime_app.search import PREFIX_SCORE, SUBSTRING_SCORE, ExperimentSearchIndex
+
+
+class StaticReadModel:
+    """A read model serving a fixed tuple of records."""
+
+    def __init__(self, records: list[ExperimentRecord]) -> None:
+        self._records = tuple(records)
+
+    def records(self) -> tuple[ExperimentRecord, ...]:
+        return self._records
+
+
+def record(experiment_id: int, title: str, proposal: int | None = None) -> ExperimentRecord:
+    """Returns an experiment record with the given title and proposal."""
+    return ExperimentRecord(experiment_id, title, 1, 1, proposal, "New", None)
+
+
+def test_substring_matches_are_found_among_many_similar_records():
+    # Many fuzzy matches share more trigrams with the query than the substring match does
+    records = [record(experiment_id, "anvil cell heap at") for experiment_id in range(1, 1001)]
+    records.append(record(1001, "In situ diamond anvil cell heating"))
+    index = ExperimentSearchIndex(StaticReadModel(records))
+
+    results = index.search("anvil cell heat", limit=5)
+
+    assert len(results) == 5
+    assert (results[0][0].id, results[0][1]) == (1001, SUBSTRING_SCORE)
+
+
+def test_proposals_only_match_exactly_or_by_prefix():
+    index = ExperimentSearchIndex(StaticReadModel([record(1, "A", 12345), record(2, "B", 91234)]))
+
+    results = index.search("1234")
+
+    assert [(result.id, score) for result, score in results] == [(1, PREFIX_SCORE)]
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+# ----------------------------------------------------------------------------------
+# Project: BeamtimeApp
+# File: tests/test_utils.py
+# ----------------------------------------------------------------------------------
+# Purpose:
+# This file is used to test the utility functions and classes of the app.
+# ----------------------------------------------------------------------------------
+# Author: Christofanis Skordas
+#
+# Copyright (C) 2025 GSECARS, The University of Chicago, USA
+# Copyright (C) 2025 NSF SEES, USA
+# ----------------------------------------------------------------------------------
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from beamtime_app.utils import SingleFlight
+
+
+class Interrupted(BaseException):
+    """Stands in for SystemExit or KeyboardInterrupt raised in the leader."""
+
+
+def test_single_flight_releases_waiters_when_the_leader_is_interrupted():
+    flight = SingleFlight()
+    release = threading.Event()
+
+    def interrupted():
+        release.wait(5)
+        raise Interrupted()
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        leader = executor.submit(flight.do, "path", interrupted)
+        while "path" not in flight._calls:
+            time.sleep(0.001)
+        waiter = executor.submit(flight.do, "path", lambda: "unused")
+        time.sleep(0.05)
+        release.set()
+
+        with pytest.raises(Interrupted):
+            leader.result(timeout=5)
+        with pytest.raises(RuntimeError):
+            waiter.result(timeout=5)
+
+    assert flight.do("path", lambda: "done") == "done"
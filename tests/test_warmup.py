@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+# ----------------------------------------------------------------------------------
+# Project: BeamtimeApp
+# File: tests/test_warmup.py
+# ----------------------------------------------------------------------------------
+# Purpose:
+# This file is used to test the worker warm-up and the /ready endpoint.
+# ----------------------------------------------------------------------------------
+# Author: Christofanis Skordas
+#
+# Copyright (C) 2025 GSECARS, The University of Chicago, USA
+# Copyright (C) 2025 NSF SEES, USA
+# ----------------------------------------------------------------------------------
+
+import threading
+import time
+
+from beamtime_app import create_flask_app, routes, warmup
+from beamtime_app.warmup import WarmUp
+
+
+def test_ready_reports_ready_once_the_first_request_warmed_up_the_worker(all_tables, monkeypatch):
+    worker_warmup = WarmUp(retry_delay=0)
+    monkeypatch.setattr(warmup, "WARMUP", worker_warmup)
+    monkeypatch.setattr(routes, "WARMUP", worker_warmup)
+
+    # Hold the last phase until the first response has been checked
+    release = threading.Event()
+    load_caches = WarmUp._load_caches
+    monkeypatch.setattr(WarmUp, "_load_caches", staticmethod(lambda: release.wait(5) and load_caches()))
+
+    app = create_flask_app()
+    assert worker_warmup.status()["total"] == 0.0
+
+    client = app.test_client()
+    response = client.get("/ready")
+    assert response.status_code == 503
+    assert response.get_json()["ready"] is False
+
+    release.set()
+    deadline = time.monotonic() + 5
+    while not worker_warmup.ready and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    response = client.get("/ready")
+    assert response.status_code == 200
+    assert set(response.get_json()["phases"]) == {"mappers", "connections", "templates", "statements", "caches"}